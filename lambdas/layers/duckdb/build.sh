@@ -21,7 +21,7 @@ pip install \
     --implementation cp \
     --python-version 3.11 \
     --only-binary=:all: \
-    duckdb==0.10.0
+    duckdb==1.1.3
 
 # Create the layer zip
 echo "Creating zip file..."
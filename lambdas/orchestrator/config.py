@@ -84,6 +84,25 @@ def get_azure_openai_config():
     }
 
 
+# HTTP connection pool for the shared Azure OpenAI client
+AZURE_OPENAI_TIMEOUT_SECONDS = float(os.environ.get('AZURE_OPENAI_TIMEOUT_SECONDS', '60'))
+AZURE_OPENAI_CONNECT_TIMEOUT_SECONDS = float(os.environ.get('AZURE_OPENAI_CONNECT_TIMEOUT_SECONDS', '5'))
+AZURE_OPENAI_MAX_CONNECTIONS = int(os.environ.get('AZURE_OPENAI_MAX_CONNECTIONS', '40'))
+AZURE_OPENAI_MAX_KEEPALIVE = int(os.environ.get('AZURE_OPENAI_MAX_KEEPALIVE', '20'))
+AZURE_OPENAI_KEEPALIVE_EXPIRY_SECONDS = float(os.environ.get('AZURE_OPENAI_KEEPALIVE_EXPIRY_SECONDS', '120'))
+
+# HTTP connection pool, timeouts and retries for the shared boto3 clients
+AWS_MAX_POOL_CONNECTIONS = int(os.environ.get('AWS_MAX_POOL_CONNECTIONS', '64'))
+AWS_CONNECT_TIMEOUT_SECONDS = float(os.environ.get('AWS_CONNECT_TIMEOUT_SECONDS', '2'))
+AWS_MAX_ATTEMPTS = int(os.environ.get('AWS_MAX_ATTEMPTS', '3'))
+# Lambda invokes are never retried: a retry after a read timeout would start a
+# second query_data run (and log write) while the first is still executing.
+# One attempt of at most AWS_LAMBDA_READ_TIMEOUT_SECONDS, plus the LLM calls
+# around it, must fit within the orchestrator's own 300s Lambda timeout.
+AWS_LAMBDA_READ_TIMEOUT_SECONDS = float(os.environ.get('AWS_LAMBDA_READ_TIMEOUT_SECONDS', '180'))
+AWS_KNOWLEDGE_BASE_READ_TIMEOUT_SECONDS = float(os.environ.get('AWS_KNOWLEDGE_BASE_READ_TIMEOUT_SECONDS', '15'))
+
+
 # Legacy compatibility - these will be populated on first access
 # For Phase 2 LLM integration
 AZURE_OPENAI_ENDPOINT = None  # Use get_azure_openai_config() instead
@@ -101,6 +120,14 @@ DEFAULT_SQL_LIMIT = 100
 MAX_VECTOR_RESULTS = 10
 DEFAULT_VECTOR_RESULTS = 5
 
+# Exact-match response cache (per warm container)
+RESPONSE_CACHE_SIZE = int(os.environ.get('RESPONSE_CACHE_SIZE', '512'))
+RESPONSE_CACHE_TTL_SECONDS = int(os.environ.get('RESPONSE_CACHE_TTL_SECONDS', '600'))
+
+# Exact-match LLM completion cache (keyed on the full request payload)
+LLM_CACHE_SIZE = int(os.environ.get('LLM_CACHE_SIZE', '256'))
+LLM_CACHE_TTL_SECONDS = int(os.environ.get('LLM_CACHE_TTL_SECONDS', '600'))
+
 # =============================================================================
 # SCHEMA DEFINITIONS
 # =============================================================================
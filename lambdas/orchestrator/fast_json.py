@@ -0,0 +1,39 @@
+"""
+Fast JSON helpers
+
+Uses orjson when it is installed (C extension, several times faster than the
+stdlib for request/response bodies) and falls back to the json module
+otherwise, so local runs work without extra dependencies.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the deployment package
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize obj to a compact JSON string.
+
+    Values neither backend handles (e.g. Decimal) are converted with str(),
+    and non-str dict keys are stringified by both. The output is not
+    byte-identical across backends:
+
+    - datetimes: orjson writes ISO 8601 ("2024-01-02T03:04:05"), the stdlib
+      falls back to str() ("2024-01-02 03:04:05")
+    - NaN/Infinity: orjson writes null, the stdlib writes NaN/Infinity
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str, separators=(",", ":"))
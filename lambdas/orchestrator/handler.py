@@ -5,12 +5,15 @@ Main entry point for the custom agent orchestrator.
 Uses LLM-driven tool calling for intelligent query routing.
 """
 
-import json
 import logging
+import re
 from dataclasses import dataclass
 from typing import Any, Optional
 
-from llm_orchestrator import LLMOrchestrator
+import fast_json
+from config import RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL_SECONDS
+from llm_orchestrator import LLMOrchestrator, MAX_HISTORY_MESSAGES
+from ttl_cache import TTLCache
 
 # Configure logging
 logger = logging.getLogger()
@@ -21,15 +24,29 @@ logger.setLevel(logging.INFO)
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ChatRequest:
     """Incoming chat request."""
     message: str
     conversation_history: list
     session_id: Optional[str] = None
 
+    def __post_init__(self):
+        # Only the last MAX_HISTORY_MESSAGES turns ever reach the prompt;
+        # drop the rest at the edge so they aren't carried through the request
+        self.conversation_history = (self.conversation_history or [])[-MAX_HISTORY_MESSAGES:]
 
-@dataclass
+    @classmethod
+    def from_body(cls, body: dict) -> 'ChatRequest':
+        """Build a request from a parsed JSON body; missing fields get defaults."""
+        return cls(
+            message=body.get('message', ''),
+            conversation_history=body.get('conversation_history'),
+            session_id=body.get('session_id')
+        )
+
+
+@dataclass(slots=True)
 class ChatResponse:
     """Outgoing chat response."""
     response: str
@@ -37,33 +54,103 @@ class ChatResponse:
     error: Optional[str] = None
 
 
+# =============================================================================
+# RESPONSE CACHE
+# =============================================================================
+
+# normalized message -> ChatResponse
+_response_cache = TTLCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL_SECONDS)
+
+# Sentence punctuation at the end of a word ("restaurants?", "posts,") but
+# not inside tokens such as 4.5 or @handle
+_TRAILING_PUNCTUATION_RE = re.compile(r"[?!.,;:]+(?=\s|$)")
+
+
+def _cache_key(request: ChatRequest) -> Optional[str]:
+    """
+    Build the response cache key for a request.
+
+    Only first-turn questions are cacheable: with conversation history the
+    answer depends on earlier turns, not just the message.
+
+    Returns:
+        Case-, whitespace- and punctuation-normalized message, or None if
+        not cacheable
+    """
+    if request.conversation_history:
+        return None
+    return " ".join(_TRAILING_PUNCTUATION_RE.sub("", request.message.lower()).split())
+
+
 # =============================================================================
 # MAIN ORCHESTRATION
 # =============================================================================
 
+# Reused across warm invocations so the Azure OpenAI client and its
+# connection pool are only created once per container
+_orchestrator: Optional[LLMOrchestrator] = None
+
+
+def _get_orchestrator() -> LLMOrchestrator:
+    """Get or create the shared orchestrator."""
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = LLMOrchestrator()
+    return _orchestrator
+
+
 def process_chat(request: ChatRequest) -> ChatResponse:
     """
     Main chat processing function.
     Uses LLM-driven orchestration for tool selection and response generation.
+    Repeated first-turn questions are answered from the response cache.
     """
-    orchestrator = LLMOrchestrator()
-
-    result = orchestrator.orchestrate(
+    cache_key = _cache_key(request)
+    if cache_key:
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Response cache hit")
+            return cached
+
+    result = _get_orchestrator().orchestrate(
         user_message=request.message,
         conversation_history=request.conversation_history
     )
 
-    return ChatResponse(
+    response = ChatResponse(
         response=result.response,
         metadata=result.metadata,
         error=result.error
     )
 
+    # Never cache failures; the next attempt may succeed
+    if cache_key and not response.error:
+        _response_cache.put(cache_key, response)
+
+    return response
+
 
 # =============================================================================
 # LAMBDA HANDLER
 # =============================================================================
 
+RESPONSE_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key',
+    'Access-Control-Allow-Methods': 'POST,OPTIONS'
+}
+
+
+def _response(status_code: int, body: dict) -> dict:
+    """Build an API Gateway proxy response with a JSON body."""
+    return {
+        'statusCode': status_code,
+        'headers': RESPONSE_HEADERS,
+        'body': fast_json.dumps(body)
+    }
+
+
 def handler(event: dict, context: Any) -> dict:
     """
     Lambda handler for chat endpoint.
@@ -73,73 +160,40 @@ def handler(event: dict, context: Any) -> dict:
     - conversation_history: List of previous messages
     - session_id: Optional session identifier
     """
-    logger.info(f"Received event: {json.dumps(event)}")
+    logger.info("Received event: %r", event)
 
     try:
         # Parse request
         body = event
         if 'body' in event:
             # API Gateway format
-            body = json.loads(event['body']) if isinstance(event['body'], str) else event['body']
+            body = fast_json.loads(event['body']) if isinstance(event['body'], (str, bytes)) else event['body']
 
-        request = ChatRequest(
-            message=body.get('message', ''),
-            conversation_history=body.get('conversation_history', []),
-            session_id=body.get('session_id')
-        )
+        request = ChatRequest.from_body(body)
 
         if not request.message:
-            return {
-                'statusCode': 400,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*',
-                    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key',
-                    'Access-Control-Allow-Methods': 'POST,OPTIONS'
-                },
-                'body': json.dumps({
-                    'error': 'Message is required'
-                })
-            }
+            return _response(400, {'error': 'Message is required'})
 
         # Process chat
         response = process_chat(request)
 
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key',
-                'Access-Control-Allow-Methods': 'POST,OPTIONS'
-            },
-            'body': json.dumps({
-                'response': response.response,
-                'metadata': response.metadata,
-                'error': response.error
-            })
-        }
+        return _response(200, {
+            'response': response.response,
+            'metadata': response.metadata,
+            'error': response.error
+        })
 
     except Exception as e:
         logger.error(f"Handler error: {str(e)}", exc_info=True)
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key',
-                'Access-Control-Allow-Methods': 'POST,OPTIONS'
-            },
-            'body': json.dumps({
-                'error': f"Internal error: {str(e)}",
-                'response': "I apologize, but I encountered an error processing your request. Please try again.",
-                'metadata': {
-                    'tools_used': [],
-                    'confidence': 0,
-                    'validation_status': 'ERROR'
-                }
-            })
-        }
+        return _response(500, {
+            'error': f"Internal error: {str(e)}",
+            'response': "I apologize, but I encountered an error processing your request. Please try again.",
+            'metadata': {
+                'tools_used': [],
+                'confidence': 0,
+                'validation_status': 'ERROR'
+            }
+        })
 
 
 # =============================================================================
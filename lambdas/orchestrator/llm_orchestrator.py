@@ -5,15 +5,33 @@ Main orchestration class using Azure OpenAI with function calling.
 Replaces procedural pattern-matching with LLM-driven tool selection.
 """
 
+import hashlib
 import json
 import logging
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from itertools import islice
 from typing import Any, Optional
 
+import httpx
 from openai import AzureOpenAI
 
-from config import TABLE_SCHEMAS, get_azure_openai_config
+import fast_json
+from config import (
+    TABLE_SCHEMAS,
+    AZURE_OPENAI_TIMEOUT_SECONDS,
+    AZURE_OPENAI_CONNECT_TIMEOUT_SECONDS,
+    AZURE_OPENAI_MAX_CONNECTIONS,
+    AZURE_OPENAI_MAX_KEEPALIVE,
+    AZURE_OPENAI_KEEPALIVE_EXPIRY_SECONDS,
+    LLM_CACHE_SIZE,
+    LLM_CACHE_TTL_SECONDS,
+    get_azure_openai_config,
+)
 from prompts import get_system_prompt, get_help_response, get_error_message
 from tool_definitions import (
     get_tool_definitions,
@@ -26,7 +44,9 @@ from tools import (
     invoke_query_data,
     invoke_vector_search,
     invoke_response_validator,
+    ValidationResult,
 )
+from ttl_cache import TTLCache
 
 
 # Content query detection keywords
@@ -50,9 +70,47 @@ CONTENT_KEYWORDS = {
 }
 
 
+def _keyword_trie_pattern(keywords) -> str:
+    """
+    Build a prefix-factored regex that matches if any keyword occurs.
+
+    Keywords sharing a prefix share one branch (e.g. "s(?:ea(?:food|ting)|...)"),
+    so the regex engine tries each character once per position instead of
+    once per keyword. A keyword that is a prefix of another ends its branch,
+    since only "does any keyword occur" matters here.
+
+    Args:
+        keywords: Literal keywords to match
+
+    Returns:
+        Regex source string
+    """
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        if "" in node:
+            return ""
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+# Single-pass matcher for CONTENT_KEYWORDS (substring semantics, like `in`)
+_CONTENT_KEYWORDS_RE = re.compile(_keyword_trie_pattern(CONTENT_KEYWORDS))
+
+
+@lru_cache(maxsize=1024)
 def is_content_based_query(user_query: str) -> bool:
     """
     Detect if a user query is content-based (requires semantic search).
+    Memoized: the orchestrator re-checks the same message on every
+    query_database call in a turn, and repeat questions are common.
 
     Args:
         user_query: The user's original question
@@ -60,8 +118,7 @@ def is_content_based_query(user_query: str) -> bool:
     Returns:
         True if query contains content-related keywords
     """
-    query_lower = user_query.lower()
-    return any(keyword in query_lower for keyword in CONTENT_KEYWORDS)
+    return _CONTENT_KEYWORDS_RE.search(user_query.lower()) is not None
 
 logger = logging.getLogger(__name__)
 
@@ -73,12 +130,173 @@ MAX_ITERATIONS = 5
 DEFAULT_TEMPERATURE = 0.1
 MAX_HISTORY_MESSAGES = 10
 
+# TABLE_SCHEMAS is static, so the system prompt is formatted once at import
+SYSTEM_PROMPT = get_system_prompt(TABLE_SCHEMAS)
+
+# Shared by every request; the OpenAI client only reads it
+_SYSTEM_MSG = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Tool definitions are static as well
+TOOL_DEFINITIONS = get_tool_definitions()
+
+# Short final answers without digits, tables, handles or bold names make no
+# claims the validator could check ("No results found."), so skip the call
+TRIVIAL_RESPONSE_MAX_CHARS = 80
+_CLAIM_MARKERS_RE = re.compile(r"[\d|@]|\*\*")
+
+# Messages that are only a greeting or a request for help are answered
+# from the static help text without calling the LLM. Matched on the whole
+# message after lowercasing and dropping punctuation.
+HELP_FAST_PATH = {
+    "hi": "greeting",
+    "hey": "greeting",
+    "hello": "greeting",
+    "good morning": "greeting",
+    "good afternoon": "greeting",
+    "good evening": "greeting",
+    "help": "general",
+    "what can you do": "general",
+    "what can you help with": "general",
+    "how can you help": "general",
+    "how do i use this": "general",
+}
+_PUNCTUATION_RE = re.compile(r"[^\w\s]+")
+
+# Runs the speculative knowledge-base search for content queries alongside
+# the SQL call (shared across warm invocations)
+HYBRID_MAX_WORKERS = 2
+_hybrid_executor = ThreadPoolExecutor(max_workers=HYBRID_MAX_WORKERS, thread_name_prefix="hybrid-search")
+_hybrid_slots = threading.BoundedSemaphore(HYBRID_MAX_WORKERS)
+
+# SQL results with at most this many rows are sparse; content queries then
+# get knowledge-base results too
+HYBRID_SPARSE_ROW_COUNT = 5
+# Trailing LIMIT of a query; a small one guarantees a sparse result
+_FINAL_LIMIT_RE = re.compile(r"\bLIMIT\s+(\d+)\s*;?\s*$", re.IGNORECASE)
+
+# Raw query rows returned to the model, which quotes exact values from them
+MAX_SAMPLE_ROWS = 50
+
+# Executes the tool calls of one LLM turn concurrently (kept separate from
+# _hybrid_executor, which tool calls themselves submit to)
+MAX_PARALLEL_TOOL_CALLS = 4
+_tool_executor = ThreadPoolExecutor(max_workers=MAX_PARALLEL_TOOL_CALLS, thread_name_prefix="tool-call")
+_tool_slots = threading.BoundedSemaphore(MAX_PARALLEL_TOOL_CALLS)
+
+
+def _try_submit(executor: ThreadPoolExecutor, slots: threading.BoundedSemaphore, fn, *args, **kwargs):
+    """
+    Submit work to a shared pool only if one of its workers is free.
+
+    The pools are per process: a Lambda container serves one request at a
+    time, but the threaded local server and gunicorn share them across
+    concurrent users. Rather than queue behind another request's slow
+    Lambda calls, a busy pool hands the work back to the caller's thread.
+
+    Args:
+        executor: Pool to run fn on
+        slots: Semaphore sized to the pool's max_workers
+        fn: Callable to run, with *args/**kwargs
+
+    Returns:
+        Future, or None if the pool is busy and the caller should run fn itself
+    """
+    if not slots.acquire(blocking=False):
+        return None
+    try:
+        future = executor.submit(fn, *args, **kwargs)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    return future
+
+
+# Tools that wait on a Lambda/Bedrock round trip. Others (help text) are
+# answered in-process and are cheaper to run inline than to hand off.
+IO_BOUND_TOOLS = frozenset({TOOL_QUERY_DATABASE, TOOL_SEARCH_KNOWLEDGE_BASE})
+
+# Arguments (with their defaults) that determine each tool's result. Free
+# text such as the query_database explanation is reworded on nearly every
+# call, so it is left out of the repeat-call key.
+_RESULT_ARGUMENTS = {
+    TOOL_QUERY_DATABASE: (("sql", None),),
+    TOOL_SEARCH_KNOWLEDGE_BASE: (("query", None), ("top_k", 5)),
+    TOOL_GET_HELP_INFO: (("topic", None),),
+}
+
+
+def _tool_call_key(tool_name: str, tool_args: dict) -> tuple:
+    """Key a tool call by the arguments that affect its result."""
+    result_args = _RESULT_ARGUMENTS.get(tool_name)
+    if result_args is None:
+        return tool_name, json.dumps(tool_args, sort_keys=True)
+    return tool_name, json.dumps([tool_args.get(name, default) for name, default in result_args])
+
+
+# Completions for identical (deployment, temperature, messages) requests.
+# Tool results are part of the messages, so changed data changes the key.
+_llm_cache = TTLCache(LLM_CACHE_SIZE, LLM_CACHE_TTL_SECONDS)
+
+
+def _llm_cache_key(deployment: str, messages: list) -> str:
+    """Hash an LLM request payload into a cache key."""
+    payload = json.dumps(
+        messages,
+        sort_keys=True,
+        default=lambda m: m.model_dump(exclude_none=True) if hasattr(m, "model_dump") else str(m),
+    )
+    return hashlib.sha256(
+        f"{deployment}|{DEFAULT_TEMPERATURE}|{payload}".encode()
+    ).hexdigest()
+
+
+# Azure OpenAI client (lazy initialization, shared by all orchestrators so
+# warm invocations reuse its keep-alive connections)
+_azure_client = None
+_azure_config = None
+
+
+def get_azure_config() -> dict:
+    """Get Azure OpenAI configuration (loaded once per container)."""
+    global _azure_config
+    if _azure_config is None:
+        _azure_config = get_azure_openai_config()
+    return _azure_config
+
+
+def get_azure_client() -> AzureOpenAI:
+    """Get or create the shared Azure OpenAI client."""
+    global _azure_client
+    if _azure_client is None:
+        config = get_azure_config()
+        # Explicit pool so concurrent tool turns and warm invocations keep
+        # TLS connections to Azure alive instead of re-handshaking
+        http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=AZURE_OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=AZURE_OPENAI_MAX_KEEPALIVE,
+                keepalive_expiry=AZURE_OPENAI_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            timeout=httpx.Timeout(
+                AZURE_OPENAI_TIMEOUT_SECONDS,
+                connect=AZURE_OPENAI_CONNECT_TIMEOUT_SECONDS,
+            ),
+        )
+        _azure_client = AzureOpenAI(
+            azure_endpoint=config['endpoint'],
+            api_key=config['api_key'],
+            api_version=config['api_version'],
+            http_client=http_client,
+        )
+    return _azure_client
+
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class OrchestrationResult:
     """Result from LLM orchestration."""
     response: str
@@ -86,7 +304,7 @@ class OrchestrationResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolExecutionResult:
     """Result from executing a tool."""
     success: bool
@@ -94,6 +312,7 @@ class ToolExecutionResult:
     tool_name: str
     execution_time_ms: int
     error: Optional[str] = None
+    allowed_values: Optional[dict] = None
 
 
 # =============================================================================
@@ -110,29 +329,17 @@ class LLMOrchestrator:
     3. Available tool definitions
     """
 
-    def __init__(self):
-        """Initialize the orchestrator with Azure OpenAI client."""
-        self._client = None
-        self._config = None
-
-    @property
+    # client and deployment are resolved on first use, then stored on the
+    # instance so later reads in the orchestration loop are plain attribute lookups
+    @cached_property
     def client(self) -> AzureOpenAI:
-        """Lazy-load Azure OpenAI client."""
-        if self._client is None:
-            self._config = get_azure_openai_config()
-            self._client = AzureOpenAI(
-                azure_endpoint=self._config['endpoint'],
-                api_key=self._config['api_key'],
-                api_version=self._config['api_version'],
-            )
-        return self._client
+        """Shared Azure OpenAI client (created on first use)."""
+        return get_azure_client()
 
-    @property
+    @cached_property
     def deployment(self) -> str:
         """Get deployment name."""
-        if self._config is None:
-            self._config = get_azure_openai_config()
-        return self._config['deployment']
+        return get_azure_config()['deployment']
 
     def orchestrate(
         self,
@@ -150,17 +357,40 @@ class LLMOrchestrator:
             OrchestrationResult with response and metadata
         """
         start_time = time.time()
+
+        help_topic = HELP_FAST_PATH.get(
+            " ".join(_PUNCTUATION_RE.sub("", user_message).lower().split())
+        )
+        if help_topic:
+            return OrchestrationResult(
+                response=get_help_response(help_topic),
+                metadata={
+                    'tools_used': [TOOL_GET_HELP_INFO],
+                    'sql_executed': None,
+                    'confidence': 1.0,
+                    'validation_status': 'N/A',
+                    'iterations': 0,
+                    'response_time_ms': int((time.time() - start_time) * 1000),
+                }
+            )
+
         tools_used = []
         sql_executed = None
+        allowed_values = None
+        # Successful tool results (and their serialized content) for this
+        # request, keyed by (tool name, result-determining arguments)
+        call_cache = {}
         confidence = 0.0
         validation_status = 'N/A'
+        # (cache key, completion) pairs from this run; only cached once the
+        # run succeeds, so a failed run is retried against the LLM
+        fresh_completions = []
 
         try:
             # Build messages
             messages = self._build_messages(user_message, conversation_history)
 
-            # Get tool definitions
-            tools = get_tool_definitions()
+            tools = TOOL_DEFINITIONS
 
             # Run orchestration loop
             iteration = 0
@@ -169,42 +399,55 @@ class LLMOrchestrator:
                 logger.info(f"Orchestration iteration {iteration}")
 
                 # Call LLM
-                response = self.client.chat.completions.create(
-                    model=self.deployment,
-                    messages=messages,
-                    tools=tools,
-                    tool_choice="auto",
-                    temperature=DEFAULT_TEMPERATURE,
-                )
+                response = self._create_completion(messages, tools, fresh_completions)
 
                 assistant_message = response.choices[0].message
 
                 # Check if LLM wants to call tools
                 if assistant_message.tool_calls:
-                    # Process tool calls
-                    messages.append(assistant_message)
+                    # Process tool calls; a plain dict is serialized directly
+                    # by the client and the cache key on later iterations
+                    messages.append(assistant_message.model_dump(exclude_none=True))
 
+                    calls = []
                     for tool_call in assistant_message.tool_calls:
+                        tool_args = fast_json.loads(tool_call.function.arguments)
+                        logger.info(f"Tool call: {tool_call.function.name} with args: {tool_args}")
+                        calls.append((tool_call, tool_args))
+
+                    # Repeated calls within this request reuse the earlier result
+                    keys = [
+                        _tool_call_key(tool_call.function.name, tool_args)
+                        for tool_call, tool_args in calls
+                    ]
+                    pending = {}
+                    for call, key in zip(calls, keys):
+                        if key not in call_cache:
+                            pending.setdefault(key, call)
+                    fresh = dict(zip(pending, self._execute_tool_calls(list(pending.values()), user_message)))
+
+                    for (tool_call, tool_args), key in zip(calls, keys):
                         tool_name = tool_call.function.name
-                        tool_args = json.loads(tool_call.function.arguments)
-
-                        logger.info(f"Tool call: {tool_name} with args: {tool_args}")
-
-                        # Execute tool
-                        tool_result = self._execute_tool(
-                            tool_name, tool_args, user_message
-                        )
-                        tools_used.append(tool_name)
-
-                        # Track SQL if executed
+                        if key in call_cache:
+                            tool_result, content = call_cache[key]
+                            tools_used.append(f"{tool_name}:cached")
+                        else:
+                            tool_result = fresh[key]
+                            content = fast_json.dumps(tool_result.result)
+                            if tool_result.success:
+                                call_cache[key] = (tool_result, content)
+                            tools_used.append(tool_name)
+
+                        # Track SQL and its evidence values for validation
                         if tool_name == TOOL_QUERY_DATABASE and tool_result.success:
                             sql_executed = tool_args.get('sql')
+                            allowed_values = tool_result.allowed_values
 
                         # Add tool result to messages
                         messages.append({
                             "role": "tool",
                             "tool_call_id": tool_call.id,
-                            "content": json.dumps(tool_result.result),
+                            "content": content,
                         })
                 else:
                     # LLM provided final response
@@ -213,12 +456,12 @@ class LLMOrchestrator:
                     # Validate response if SQL was executed
                     if sql_executed and response_text:
                         validation = self._validate_response(
-                            response_text, sql_executed, tools_used
+                            response_text, sql_executed, tools_used, allowed_values
                         )
                         response_text = validation.validated_response
                         confidence = validation.confidence_score
                         validation_status = validation.action
-                        if 'response_validator' not in tools_used:
+                        if validation.action != 'SKIP_TRIVIAL' and 'response_validator' not in tools_used:
                             tools_used.append('response_validator')
                     else:
                         confidence = 1.0
@@ -226,6 +469,9 @@ class LLMOrchestrator:
 
                     response_time_ms = int((time.time() - start_time) * 1000)
 
+                    for cache_key, completion in fresh_completions:
+                        _llm_cache.put(cache_key, completion)
+
                     return OrchestrationResult(
                         response=response_text,
                         metadata={
@@ -267,6 +513,36 @@ class LLMOrchestrator:
                 error=str(e)
             )
 
+    def _create_completion(self, messages: list, tools: list, fresh_completions: list):
+        """
+        Call the chat completions API, serving exact repeats from cache.
+
+        Args:
+            messages: Messages for this LLM call
+            tools: Tool definitions offered to the model
+            fresh_completions: Receives (cache key, completion) for uncached
+                calls; the caller caches them once the run succeeds
+
+        Returns:
+            ChatCompletion response
+        """
+        deployment = self.deployment
+        cache_key = _llm_cache_key(deployment, messages)
+        response = _llm_cache.get(cache_key)
+        if response is not None:
+            logger.info("LLM cache hit")
+            return response
+
+        response = self.client.chat.completions.create(
+            model=deployment,
+            messages=messages,
+            tools=tools,
+            tool_choice="auto",
+            temperature=DEFAULT_TEMPERATURE,
+        )
+        fresh_completions.append((cache_key, response))
+        return response
+
     def _build_messages(
         self,
         user_message: str,
@@ -282,15 +558,13 @@ class LLMOrchestrator:
         Returns:
             List of message dicts for the API call
         """
-        messages = [
-            {"role": "system", "content": get_system_prompt(TABLE_SCHEMAS)}
-        ]
+        messages = [_SYSTEM_MSG]
 
         # Add conversation history (limited to prevent token overflow)
         if conversation_history:
-            # Take only the last N messages
-            recent_history = conversation_history[-MAX_HISTORY_MESSAGES:]
-            for msg in recent_history:
+            # Take only the last N messages, without copying the history
+            start = max(len(conversation_history) - MAX_HISTORY_MESSAGES, 0)
+            for msg in islice(conversation_history, start, None):
                 role = msg.get('role', 'user')
                 content = msg.get('content', '')
                 if role in ('user', 'assistant') and content:
@@ -332,116 +606,18 @@ class LLMOrchestrator:
                 error=error
             )
 
-        try:
-            if tool_name == TOOL_QUERY_DATABASE:
-                sql = arguments["sql"]
-                query_result = invoke_query_data(sql, user_query=user_message)
-
-                if query_result.success:
-                    # Hybrid approach: Check if we should also run semantic search
-                    is_content_query = is_content_based_query(user_message)
-                    is_sparse = query_result.row_count <= 5
-
-                    logger.info(
-                        f"[HYBRID CHECK] row_count={query_result.row_count}, "
-                        f"is_sparse={is_sparse}, is_content_query={is_content_query}, "
-                        f"user_message='{user_message}'"
-                    )
-
-                    should_add_semantic = is_sparse and is_content_query
-
-                    semantic_results = None
-                    if should_add_semantic:
-                        logger.info(
-                            f"[HYBRID TRIGGER] SQL returned {query_result.row_count} rows "
-                            f"for content query. Adding semantic search results."
-                        )
-                        # Automatically invoke semantic search
-                        semantic_result = invoke_vector_search(user_message, top_k=10)
-                        if semantic_result.success:
-                            semantic_results = semantic_result.results
-                            logger.info(f"[HYBRID SUCCESS] Found {len(semantic_results)} semantic results")
-
-                    # Build combined result
-                    result = {
-                        "success": True,
-                        "data": query_result.data[:50],
-                        "row_count": query_result.row_count,
-                        "columns": query_result.columns,
-                        "markdown_table": query_result.markdown_table,
-                        "allowed_values": query_result.allowed_values,
-                        "result_summary": (
-                            f"SQL query returned {query_result.row_count} results. "
-                            f"Original user query: '{user_message}'"
-                        ),
-                    }
-
-                    # Add semantic results if available
-                    if semantic_results:
-                        result["semantic_results"] = semantic_results
-                        result["result_summary"] += (
-                            f"\n\nAdditionally, semantic search found "
-                            f"{len(semantic_results)} relevant items. "
-                            f"Consider combining both SQL and semantic results "
-                            f"for a comprehensive answer."
-                        )
-                else:
-                    result = {
-                        "success": False,
-                        "error": query_result.error,
-                    }
-
-                return ToolExecutionResult(
-                    success=query_result.success,
-                    result=result,
-                    tool_name=tool_name,
-                    execution_time_ms=int((time.time() - start_time) * 1000),
-                )
-
-            elif tool_name == TOOL_SEARCH_KNOWLEDGE_BASE:
-                query = arguments["query"]
-                top_k = arguments.get("top_k", 5)
-                search_result = invoke_vector_search(query, top_k=top_k)
-
-                if search_result.success:
-                    result = {
-                        "success": True,
-                        "results": search_result.results,
-                        "query": search_result.query,
-                    }
-                else:
-                    result = {
-                        "success": False,
-                        "error": search_result.error,
-                    }
-
-                return ToolExecutionResult(
-                    success=search_result.success,
-                    result=result,
-                    tool_name=tool_name,
-                    execution_time_ms=int((time.time() - start_time) * 1000),
-                )
-
-            elif tool_name == TOOL_GET_HELP_INFO:
-                topic = arguments["topic"]
-                help_text = get_help_response(topic)
-
-                return ToolExecutionResult(
-                    success=True,
-                    result={"help_text": help_text},
-                    tool_name=tool_name,
-                    execution_time_ms=int((time.time() - start_time) * 1000),
-                )
-
-            else:
-                return ToolExecutionResult(
-                    success=False,
-                    result={"error": f"Unknown tool: {tool_name}"},
-                    tool_name=tool_name,
-                    execution_time_ms=int((time.time() - start_time) * 1000),
-                    error=f"Unknown tool: {tool_name}"
-                )
+        handler = self._TOOL_HANDLERS.get(tool_name)
+        if handler is None:
+            return ToolExecutionResult(
+                success=False,
+                result={"error": f"Unknown tool: {tool_name}"},
+                tool_name=tool_name,
+                execution_time_ms=int((time.time() - start_time) * 1000),
+                error=f"Unknown tool: {tool_name}"
+            )
 
+        try:
+            return handler(self, arguments, user_message, start_time)
         except Exception as e:
             logger.error(f"Tool execution error for {tool_name}: {e}")
             return ToolExecutionResult(
@@ -452,11 +628,190 @@ class LLMOrchestrator:
                 error=str(e)
             )
 
+    def _run_query_database(
+        self,
+        arguments: dict,
+        user_message: str,
+        start_time: float
+    ) -> ToolExecutionResult:
+        """Run SQL via query_data, adding semantic results for sparse content queries."""
+        sql = arguments["sql"]
+
+        # Hybrid approach: content queries may need semantic results too.
+        # They are only used if SQL comes back sparse, so the search starts
+        # alongside the SQL call only when the query's LIMIT guarantees that;
+        # otherwise it waits for the row count and dense answers skip it.
+        is_content_query = is_content_based_query(user_message)
+        limit = _FINAL_LIMIT_RE.search(sql) if is_content_query else None
+        semantic_future = (
+            _try_submit(_hybrid_executor, _hybrid_slots, invoke_vector_search, user_message, top_k=10)
+            if limit and int(limit.group(1)) <= HYBRID_SPARSE_ROW_COUNT else None
+        )
+
+        query_result = invoke_query_data(sql, user_query=user_message)
+
+        if query_result.success:
+            is_sparse = query_result.row_count <= HYBRID_SPARSE_ROW_COUNT
+
+            logger.info(
+                f"[HYBRID CHECK] row_count={query_result.row_count}, "
+                f"is_sparse={is_sparse}, is_content_query={is_content_query}, "
+                f"user_message='{user_message}'"
+            )
+
+            should_add_semantic = is_sparse and is_content_query
+
+            semantic_results = None
+            if should_add_semantic:
+                logger.info(
+                    f"[HYBRID TRIGGER] SQL returned {query_result.row_count} rows "
+                    f"for content query. Adding semantic search results."
+                )
+                semantic_result = (
+                    semantic_future.result() if semantic_future is not None
+                    else invoke_vector_search(user_message, top_k=10)
+                )
+                if semantic_result.success:
+                    semantic_results = semantic_result.results
+                    logger.info(f"[HYBRID SUCCESS] Found {len(semantic_results)} semantic results")
+
+            # Build combined result. Raw rows carry the exact values the
+            # validator checks against (the markdown table rounds numbers and
+            # truncates text); allowed_values stay local for the validator.
+            result = {
+                "success": True,
+                "sample_rows": query_result.data[:MAX_SAMPLE_ROWS],
+                "row_count": query_result.row_count,
+                "columns": query_result.columns,
+                "markdown_table": query_result.markdown_table,
+                "result_summary": (
+                    f"SQL query returned {query_result.row_count} results. "
+                    f"Original user query: '{user_message}'"
+                ),
+            }
+
+            if query_result.markdown_table:
+                result["result_summary"] += (
+                    f"\n\nmarkdown_table abbreviates numbers (K/M) and truncates "
+                    f"long text; quote exact values from sample_rows (first "
+                    f"{MAX_SAMPLE_ROWS} rows)."
+                )
+
+            # Add semantic results if available
+            if semantic_results:
+                result["semantic_results"] = semantic_results
+                result["result_summary"] += (
+                    f"\n\nAdditionally, semantic search found "
+                    f"{len(semantic_results)} relevant items. "
+                    f"Consider combining both SQL and semantic results "
+                    f"for a comprehensive answer."
+                )
+        else:
+            result = {
+                "success": False,
+                "error": query_result.error,
+            }
+
+        return ToolExecutionResult(
+            success=query_result.success,
+            result=result,
+            tool_name=TOOL_QUERY_DATABASE,
+            execution_time_ms=int((time.time() - start_time) * 1000),
+            allowed_values=query_result.allowed_values,
+        )
+
+    def _run_search_knowledge_base(
+        self,
+        arguments: dict,
+        user_message: str,
+        start_time: float
+    ) -> ToolExecutionResult:
+        """Run a semantic search over the knowledge base."""
+        query = arguments["query"]
+        top_k = arguments.get("top_k", 5)
+        search_result = invoke_vector_search(query, top_k=top_k)
+
+        if search_result.success:
+            result = {
+                "success": True,
+                "results": search_result.results,
+                "query": search_result.query,
+            }
+        else:
+            result = {
+                "success": False,
+                "error": search_result.error,
+            }
+
+        return ToolExecutionResult(
+            success=search_result.success,
+            result=result,
+            tool_name=TOOL_SEARCH_KNOWLEDGE_BASE,
+            execution_time_ms=int((time.time() - start_time) * 1000),
+        )
+
+    def _run_get_help_info(
+        self,
+        arguments: dict,
+        user_message: str,
+        start_time: float
+    ) -> ToolExecutionResult:
+        """Return static help text for a topic."""
+        topic = arguments["topic"]
+        help_text = get_help_response(topic)
+
+        return ToolExecutionResult(
+            success=True,
+            result={"help_text": help_text},
+            tool_name=TOOL_GET_HELP_INFO,
+            execution_time_ms=int((time.time() - start_time) * 1000),
+        )
+
+    # Tool name -> handler, called as handler(self, arguments, user_message, start_time)
+    _TOOL_HANDLERS = {
+        TOOL_QUERY_DATABASE: _run_query_database,
+        TOOL_SEARCH_KNOWLEDGE_BASE: _run_search_knowledge_base,
+        TOOL_GET_HELP_INFO: _run_get_help_info,
+    }
+
+    def _execute_tool_calls(self, calls: list, user_message: str) -> list:
+        """
+        Execute the tool calls of one LLM turn.
+
+        Same-turn calls are emitted together, so none can depend on another's
+        output. I/O-bound calls run concurrently on the tool pool while local
+        ones run inline; a lone call skips the pool entirely, and calls that
+        find the pool busy run inline too.
+
+        Args:
+            calls: (tool_call, parsed arguments) pairs in model-emitted order
+            user_message: Original user message (for hybrid search context)
+
+        Returns:
+            ToolExecutionResults in the same order as calls
+        """
+        if len(calls) == 1:
+            tool_call, tool_args = calls[0]
+            return [self._execute_tool(tool_call.function.name, tool_args, user_message)]
+
+        futures = [
+            _try_submit(_tool_executor, _tool_slots, self._execute_tool,
+                        tool_call.function.name, tool_args, user_message)
+            if tool_call.function.name in IO_BOUND_TOOLS else None
+            for tool_call, tool_args in calls
+        ]
+        return [
+            future.result() if future is not None
+            else self._execute_tool(tool_call.function.name, tool_args, user_message)
+            for future, (tool_call, tool_args) in zip(futures, calls)
+        ]
+
     def _validate_response(
         self,
         response_text: str,
         sql_executed: str,
-        tools_used: list
+        tools_used: list,
+        allowed_values: Optional[dict] = None
     ):
         """
         Validate the LLM response against query evidence.
@@ -465,13 +820,21 @@ class LLMOrchestrator:
             response_text: The LLM-generated response
             sql_executed: The SQL query that was executed
             tools_used: List of tools that were used
+            allowed_values: Evidence values from the most recent query result
 
         Returns:
             ValidationResult from the response validator
         """
-        # Get allowed values from the most recent query result
-        # This is tracked during tool execution
-        allowed_values = None
+        if (len(response_text) < TRIVIAL_RESPONSE_MAX_CHARS
+                and not _CLAIM_MARKERS_RE.search(response_text)):
+            return ValidationResult(
+                action='SKIP_TRIVIAL',
+                validated_response=response_text,
+                confidence_score=1.0,
+                violations_count=0,
+                violations=[],
+                details={},
+            )
 
         # Invoke response validator
         return invoke_response_validator(
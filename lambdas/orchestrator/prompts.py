@@ -4,6 +4,8 @@ Centralized Prompt Management for LLM Orchestrator
 Single source of truth for all LLM prompts - NO prompts in other code files.
 """
 
+import re
+from string import Template
 from typing import Any
 
 # =============================================================================
@@ -25,13 +27,6 @@ You have access to three tools:
 
 ## Database Schema
 {schema}
-
-## Knowledge Base
-The knowledge base contains restaurant bios and descriptions that can be searched semantically. Use this for queries about:
-- Restaurant features (outdoor seating, vegan options, ambiance)
-- Restaurant styles and cuisines
-- Atmosphere descriptions
-
 ## Tool Selection Guidelines
 
 ### When to use search_knowledge_base (PRIORITY for content-based queries):
@@ -61,28 +56,9 @@ If a query involves BOTH content matching AND ranking (e.g., "top Italian restau
 5. If you cannot fulfill a request, explain why
 
 ## Hybrid Results (Automatic Enhancement)
-
-For content-based queries, the system automatically provides BOTH SQL and semantic search results:
-- When SQL returns sparse results (0-5 rows) for content queries, semantic search is automatically executed
-- You'll receive `semantic_results` in addition to SQL `data`
-- **Always prioritize semantic results** for content queries as they better match user intent
-- Use SQL results for exact matches or structured data (counts, followers, etc.)
-- Combine both sources to provide the most comprehensive answer
-
-Example response structure:
-- If SQL returns 2 rows but semantic returns 10 items → Present semantic results as primary answer
-- If both have results → Merge and present the union, highlighting the best matches
-- Always acknowledge both data sources when presenting combined results
-
-## SQL Generation Rules
-When generating SQL:
-- Only generate SELECT queries
-- Always include a LIMIT clause (max 100 for normal queries)
-- Use ILIKE for case-insensitive text matching
-- For restaurants table: use WHERE status = 'FOUND' to filter valid restaurants
-- For posts table: use WHERE status = 'active' to filter valid posts
-- Handle NULL values appropriately
-- For hashtag analysis, use: unnest(string_split(hashtags, ' '))
+When a content query's SQL returns 0-5 rows, semantic search runs automatically and you also receive `semantic_results`:
+- **Prioritize semantic results** for content queries; use SQL results for exact matches and structured data (counts, followers, etc.)
+- If both have results, merge them, highlight the best matches and acknowledge both data sources
 
 ## Anti-Hallucination Rules
 - NEVER invent data - only report what tools return
@@ -95,7 +71,7 @@ When generating SQL:
     # TOOL DESCRIPTIONS
     # -------------------------------------------------------------------------
     "tool_descriptions": {
-        "query_database": "Execute SQL queries against the Instagram analytics database. Use this for data retrieval, counts, rankings, aggregations, and any structured data queries. The database contains 'posts' (Instagram posts with engagement metrics) and 'restaurants' (restaurant Instagram profiles) tables.",
+        "query_database": "Execute SQL queries against the Instagram analytics database. Use this for data retrieval, counts, rankings, aggregations, and any structured data queries. The database contains 'posts' (Instagram posts with engagement metrics) and 'restaurants' (restaurant Instagram profiles) tables. SQL rules: SELECT only; always include a LIMIT (max 100 for normal queries); use ILIKE for case-insensitive text matching; filter valid rows with restaurants.status = 'FOUND' and posts.status = 'active'; handle NULLs; for hashtag analysis use unnest(string_split(hashtags, ' ')).",
 
         "search_knowledge_base": "Perform semantic search on restaurant descriptions, bios, and post content. Use this FIRST when users ask about cuisine types (Italian, Thai, vegan), content themes (chef posts, desserts, healthy food), restaurant features (outdoor seating, ambiance), or any qualitative aspects. This searches actual content/bios, not hashtags or metadata. Always prefer this over SQL for content-based matching.",
 
@@ -164,6 +140,26 @@ This uses AI-powered semantic matching on restaurant bios.""",
     },
 }
 
+# Hot-path prompts are resolved once here and served by direct lookup,
+# not through get_prompt's category/key checks
+SYSTEM_PROMPT_TEMPLATE = PROMPTS["system"]["orchestrator"]
+# {schema} is the template's only placeholder, so it is filled by concatenation
+_SYSTEM_PROMPT_PREFIX, _SYSTEM_PROMPT_SUFFIX = SYSTEM_PROMPT_TEMPLATE.split("{schema}")
+ERROR_MESSAGES = PROMPTS["error_messages"]
+HELP_TOPICS = PROMPTS["help_topics"]
+_GENERAL_HELP = HELP_TOPICS["general"]
+
+# Prompts with {name} placeholders, compiled once into string.Template so
+# substitution never trips over other braces in the text. Prompts without
+# placeholders are absent and returned as-is.
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+_PROMPT_TEMPLATES = {
+    (category, key): Template(_PLACEHOLDER_RE.sub(r"${\1}", text.replace("$", "$$")))
+    for category, prompts in PROMPTS.items()
+    for key, text in prompts.items()
+    if _PLACEHOLDER_RE.search(text)
+}
+
 
 # =============================================================================
 # SCHEMA FORMATTER
@@ -177,19 +173,17 @@ def format_schema_for_prompt(table_schemas: dict) -> str:
         table_schemas: Dict with table definitions from config.py
 
     Returns:
-        Formatted schema string
+        Formatted schema string, one "- name TYPE: description" line per column
     """
-    lines = []
-    for table_name, schema in table_schemas.items():
-        lines.append(f"### {table_name} table")
-        lines.append(f"{schema.get('description', '')}")
-        lines.append("")
-        lines.append("| Column | Type | Description |")
-        lines.append("|--------|------|-------------|")
-        for col_name, col_type, col_desc in schema.get('columns', []):
-            lines.append(f"| {col_name} | {col_type} | {col_desc} |")
-        lines.append("")
-    return "\n".join(lines)
+    return "\n".join(
+        f"### {table_name} table\n"
+        f"{schema.get('description', '')}\n"
+        + "".join(
+            f"- {col_name} {col_type}: {col_desc}\n"
+            for col_name, col_type, col_desc in schema.get('columns', [])
+        )
+        for table_name, schema in table_schemas.items()
+    )
 
 
 # =============================================================================
@@ -221,25 +215,44 @@ def get_prompt(category: str, key: str, **kwargs: Any) -> str:
     if key not in PROMPTS[category]:
         raise KeyError(f"Unknown prompt key: {key} in category {category}")
 
-    template = PROMPTS[category][key]
-
     if kwargs:
-        return template.format(**kwargs)
-    return template
+        compiled = _PROMPT_TEMPLATES.get((category, key))
+        if compiled is not None:
+            return compiled.substitute(kwargs)
+    return PROMPTS[category][key]
+
+
+# Built system prompts, keyed by _freeze_schema(table_schemas)
+_SYSTEM_PROMPT_CACHE: dict[tuple, str] = {}
+
+
+def _freeze_schema(table_schemas: dict) -> tuple:
+    """Convert table schemas into a hashable key (dicts and lists are not)."""
+    return tuple(
+        (table_name, schema.get('description', ''), tuple(map(tuple, schema.get('columns', []))))
+        for table_name, schema in table_schemas.items()
+    )
 
 
 def get_system_prompt(table_schemas: dict) -> str:
     """
     Build the complete system prompt with schema information.
 
+    Prompts are cached per distinct schema, so repeated calls with the
+    static TABLE_SCHEMAS return the same string without reformatting.
+
     Args:
         table_schemas: Table schema definitions from config.py
 
     Returns:
         Complete system prompt ready for LLM
     """
-    schema_str = format_schema_for_prompt(table_schemas)
-    return get_prompt("system", "orchestrator", schema=schema_str)
+    key = _freeze_schema(table_schemas)
+    prompt = _SYSTEM_PROMPT_CACHE.get(key)
+    if prompt is None:
+        prompt = _SYSTEM_PROMPT_PREFIX + format_schema_for_prompt(table_schemas) + _SYSTEM_PROMPT_SUFFIX
+        _SYSTEM_PROMPT_CACHE[key] = prompt
+    return prompt
 
 
 def get_help_response(topic: str = "general") -> str:
@@ -250,9 +263,9 @@ def get_help_response(topic: str = "general") -> str:
         topic: Help topic key (general, sql_queries, semantic_search, greeting)
 
     Returns:
-        Help text for the topic
+        Help text for the topic, or the general help text for unknown topics
     """
-    return get_prompt("help_topics", topic)
+    return HELP_TOPICS.get(topic, _GENERAL_HELP)
 
 
 def get_error_message(error_type: str, **kwargs: Any) -> str:
@@ -265,5 +278,16 @@ def get_error_message(error_type: str, **kwargs: Any) -> str:
 
     Returns:
         Formatted error message
+
+    Raises:
+        KeyError: If error_type is not a known error message
     """
-    return get_prompt("error_messages", error_type, **kwargs)
+    try:
+        template = ERROR_MESSAGES[error_type]
+    except KeyError:
+        raise KeyError(f"Unknown prompt key: {error_type} in category error_messages") from None
+    if kwargs:
+        compiled = _PROMPT_TEMPLATES.get(("error_messages", error_type))
+        if compiled is not None:
+            return compiled.substitute(kwargs)
+    return template
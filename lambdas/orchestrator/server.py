@@ -5,9 +5,11 @@ Simple Flask server for testing the orchestrator locally.
 Serves the chat UI and provides the /chat API endpoint.
 """
 
+import hashlib
 import json
 import logging
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -15,18 +17,22 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 try:
-    from flask import Flask, request, jsonify, send_from_directory
+    from flask import Flask, Response, request
     from flask_cors import CORS
 except ImportError:
     print("Please install Flask and flask-cors:")
     print("  pip install flask flask-cors")
     sys.exit(1)
 
-# Import orchestrator (with fallback for missing AWS deps)
+import fast_json
+
+# Import orchestrator (with fallback for missing AWS deps). boto3 clients are
+# built at import, so AWS config errors (no region, unknown profile) surface
+# here too and must also fall back to mock mode.
 try:
     from lambdas.orchestrator.handler import process_chat, ChatRequest
     ORCHESTRATOR_AVAILABLE = True
-except ImportError as e:
+except Exception as e:
     print(f"Warning: Could not import orchestrator: {e}")
     print("Running in mock mode only.")
     ORCHESTRATOR_AVAILABLE = False
@@ -42,6 +48,16 @@ CORS(app)
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 UI_PATH = PROJECT_ROOT / 'ui'
+UI_FILE = UI_PATH / 'chat-test.html'
+
+# The chat UI is static: read it once and let browsers revalidate by ETag
+_UI_HTML = UI_FILE.read_bytes()
+_UI_ETAG = hashlib.md5(_UI_HTML).hexdigest()
+
+
+def _json_response(body: dict, status: int = 200):
+    """Build a JSON response, encoded with orjson when available."""
+    return app.response_class(fast_json.dumps(body), status=status, mimetype='application/json')
 
 
 # =============================================================================
@@ -135,29 +151,66 @@ Just ask me a question and I'll help you find the data!""",
 }
 
 
+# One anchored scan picks the mock response. Each alternative is a
+# lookahead over the whole message and they are tried in priority order,
+# so the first matching group wins regardless of where its keyword appears.
+_MOCK_DISPATCH = re.compile(
+    r"^(?:"
+    r"(?P<top_restaurants>(?=.*restaurant)(?=.*(?:top|show|list)))"
+    r"|(?P<posts>(?=.*(?:post|like|engagement)))"
+    r"|(?P<search>(?=.*(?:outdoor|search|find)))"
+    r"|(?P<help>(?=.*(?:help|hello|\bhi\b)))"
+    r")",
+    re.IGNORECASE | re.DOTALL,
+)
+_MOCK_GROUP_KEYS = {
+    'top_restaurants': 'top restaurants',
+    'posts': 'posts',
+    'search': 'search',
+    'help': 'help',
+}
+
+_FALLBACK_PREFIX = "I understand you're asking about: "
+_FALLBACK_SUFFIX = "\n\nCould you please be more specific? Try asking about top restaurants, popular posts, or search for specific features."
+_FALLBACK_METADATA = {
+    'tools_used': [],
+    'sql_executed': None,
+    'confidence': 0.7,
+    'validation_status': 'PASS',
+    'intent': 'general_question'
+}
+
+
+# Canned answers never change, so serialize them once
+_MOCK_RESPONSE_BODIES = {key: fast_json.dumps(value) for key, value in MOCK_RESPONSES.items()}
+
+
+def _match_mock_key(message: str) -> str | None:
+    """Return the MOCK_RESPONSES key for a message, or None for the fallback."""
+    match = _MOCK_DISPATCH.search(message)
+    return _MOCK_GROUP_KEYS[match.lastgroup] if match else None
+
+
+def _fallback_mock_response(message: str) -> dict:
+    """Build the mock reply for messages no canned answer matches."""
+    return {
+        'response': _FALLBACK_PREFIX + message + _FALLBACK_SUFFIX,
+        'metadata': _FALLBACK_METADATA,
+    }
+
+
 def get_mock_response(message: str) -> dict:
     """Get mock response based on message content."""
-    message_lower = message.lower()
-
-    if 'restaurant' in message_lower and ('top' in message_lower or 'show' in message_lower or 'list' in message_lower):
-        return MOCK_RESPONSES['top restaurants']
-    elif 'post' in message_lower or 'like' in message_lower or 'engagement' in message_lower:
-        return MOCK_RESPONSES['posts']
-    elif 'outdoor' in message_lower or 'search' in message_lower or 'find' in message_lower:
-        return MOCK_RESPONSES['search']
-    elif 'help' in message_lower or 'hello' in message_lower or 'hi' in message_lower:
-        return MOCK_RESPONSES['help']
-    else:
-        return {
-            'response': f"I understand you're asking about: {message}\n\nCould you please be more specific? Try asking about top restaurants, popular posts, or search for specific features.",
-            'metadata': {
-                'tools_used': [],
-                'sql_executed': None,
-                'confidence': 0.7,
-                'validation_status': 'PASS',
-                'intent': 'general_question'
-            }
-        }
+    key = _match_mock_key(message)
+    return MOCK_RESPONSES[key] if key else _fallback_mock_response(message)
+
+
+def _mock_json_response(message: str):
+    """Build the mock /chat response, reusing pre-serialized canned bodies."""
+    key = _match_mock_key(message)
+    if key:
+        return app.response_class(_MOCK_RESPONSE_BODIES[key], mimetype='application/json')
+    return _json_response(_fallback_mock_response(message))
 
 
 # =============================================================================
@@ -167,7 +220,10 @@ def get_mock_response(message: str) -> dict:
 @app.route('/')
 def index():
     """Serve the chat UI."""
-    return send_from_directory(UI_PATH, 'chat-test.html')
+    headers = {'ETag': f'"{_UI_ETAG}"', 'Cache-Control': 'no-cache'}
+    if _UI_ETAG in request.if_none_match:
+        return Response(status=304, headers=headers)
+    return Response(_UI_HTML, mimetype='text/html', headers=headers)
 
 
 @app.route('/chat', methods=['POST', 'OPTIONS'])
@@ -177,38 +233,30 @@ def chat():
         return '', 200
 
     try:
-        data = request.get_json()
+        data = fast_json.loads(request.get_data())
         message = data.get('message', '')
-        conversation_history = data.get('conversation_history', [])
-        session_id = data.get('session_id')
-        use_mock = data.get('mock', False)  # Default to LIVE mode
 
         if not message:
-            return jsonify({'error': 'Message is required'}), 400
+            return _json_response({'error': 'Message is required'}, 400)
 
-        logger.info(f"Received message: {message[:50]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Received message: %s...", message[:50])
 
         # Use mock mode or real orchestrator
-        if use_mock or not ORCHESTRATOR_AVAILABLE:
-            result = get_mock_response(message)
-            return jsonify(result)
+        if data.get('mock', False) or not ORCHESTRATOR_AVAILABLE:  # Default to LIVE mode
+            return _mock_json_response(message)
         else:
             # Use real orchestrator
-            chat_request = ChatRequest(
-                message=message,
-                conversation_history=conversation_history,
-                session_id=session_id
-            )
-            response = process_chat(chat_request)
-            return jsonify({
+            response = process_chat(ChatRequest.from_body(data))
+            return _json_response({
                 'response': response.response,
                 'metadata': response.metadata,
                 'error': response.error
             })
 
     except Exception as e:
-        logger.error(f"Error processing chat: {e}", exc_info=True)
-        return jsonify({
+        logger.error("Error processing chat: %s", e, exc_info=True)
+        return _json_response({
             'error': str(e),
             'response': 'Sorry, an error occurred. Please try again.',
             'metadata': {
@@ -216,13 +264,13 @@ def chat():
                 'confidence': 0,
                 'validation_status': 'ERROR'
             }
-        }), 500
+        }, 500)
 
 
 @app.route('/health')
 def health():
     """Health check endpoint."""
-    return jsonify({
+    return _json_response({
         'status': 'healthy',
         'orchestrator_available': ORCHESTRATOR_AVAILABLE
     })
@@ -248,4 +296,8 @@ if __name__ == '__main__':
 ╚══════════════════════════════════════════════════════════════╝
     """)
 
-    app.run(host='0.0.0.0', port=port, debug=debug)
+    # Each /chat call blocks for seconds on LLM and Lambda I/O; serve requests
+    # on separate threads so one slow question doesn't queue the rest.
+    # For anything beyond local testing, run under gunicorn (see RUNBOOK.md).
+    # The UI is cached in memory, so let the debug reloader restart on edits
+    app.run(host='0.0.0.0', port=port, debug=debug, threaded=True, extra_files=[str(UI_FILE)])
@@ -0,0 +1,283 @@
+"""
+Tests for the LLM orchestration loop (Azure OpenAI and tools mocked).
+"""
+
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Orchestrator modules import each other flat (as packaged for Lambda)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import llm_orchestrator
+from llm_orchestrator import LLMOrchestrator
+from prompts import get_help_response
+from tools import QueryDataResult, VectorSearchResult
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_cache():
+    llm_orchestrator._llm_cache.clear()
+    yield
+    llm_orchestrator._llm_cache.clear()
+
+
+def _tool_call(call_id, name, arguments):
+    return SimpleNamespace(
+        id=call_id,
+        type="function",
+        function=SimpleNamespace(name=name, arguments=json.dumps(arguments)),
+    )
+
+
+def _completion(content=None, tool_calls=None):
+    message = MagicMock(content=content, tool_calls=tool_calls, role="assistant")
+    message.model_dump.return_value = {"role": "assistant", "content": content}
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _run(completions, user_message="How many restaurants are there?"):
+    """Run orchestrate() against a scripted sequence of LLM completions."""
+    client = MagicMock()
+    client.chat.completions.create.side_effect = completions
+    with patch.object(llm_orchestrator, "get_azure_client", return_value=client), \
+            patch.object(llm_orchestrator, "get_azure_config", return_value={"deployment": "test"}):
+        result = LLMOrchestrator().orchestrate(user_message)
+    return result, client
+
+
+class TestParallelToolCalls:
+    """Tests for same-turn tool dispatch."""
+
+    def test_same_turn_tool_calls_overlap_and_keep_order(self):
+        """Both tools run at once; tool messages follow the model's order."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def query_data(sql, user_query=None):
+            barrier.wait()
+            return QueryDataResult(True, [{"n": 1}], ["n"], 1, "| n |", sql)
+
+        def vector_search(query, top_k=5):
+            barrier.wait()
+            return VectorSearchResult(True, [{"content": "vegan"}], query)
+
+        completions = [
+            _completion(tool_calls=[
+                _tool_call("call_kb", "search_knowledge_base", {"query": "vegan"}),
+                _tool_call("call_sql", "query_database", {"sql": "SELECT COUNT(*) AS n FROM restaurants LIMIT 1"}),
+            ]),
+            _completion(content="Here you go"),
+        ]
+        with patch.object(llm_orchestrator, "invoke_query_data", side_effect=query_data), \
+                patch.object(llm_orchestrator, "invoke_vector_search", side_effect=vector_search), \
+                patch.object(llm_orchestrator, "invoke_response_validator") as validator:
+            validator.return_value = SimpleNamespace(
+                validated_response="Here you go", confidence_score=1.0, action="PASS"
+            )
+            result, client = _run(completions)
+
+        assert result.error is None
+        assert result.metadata["tools_used"][:2] == ["search_knowledge_base", "query_database"]
+        messages = client.chat.completions.create.call_args_list[1].kwargs["messages"]
+        tool_messages = [m for m in messages if isinstance(m, dict) and m.get("role") == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == ["call_kb", "call_sql"]
+        assert all(json.loads(m["content"])["success"] for m in tool_messages)
+
+    def test_repeated_tool_call_reuses_result(self):
+        """The same call made again in one request does not hit the backend."""
+        call = {"sql": "SELECT COUNT(*) AS n FROM restaurants LIMIT 1"}
+        completions = [
+            _completion(tool_calls=[_tool_call("call_1", "query_database", call)]),
+            _completion(tool_calls=[_tool_call("call_2", "query_database", call)]),
+            _completion(content="There are 1"),
+        ]
+        with patch.object(llm_orchestrator, "invoke_query_data") as query_data, \
+                patch.object(llm_orchestrator, "invoke_response_validator") as validator:
+            query_data.return_value = QueryDataResult(True, [{"n": 1}], ["n"], 1, "| n |", call["sql"])
+            validator.return_value = SimpleNamespace(
+                validated_response="There are 1", confidence_score=1.0, action="PASS"
+            )
+            result, client = _run(completions)
+
+        assert query_data.call_count == 1
+        assert result.metadata["tools_used"][:2] == ["query_database", "query_database:cached"]
+        messages = client.chat.completions.create.call_args_list[2].kwargs["messages"]
+        tool_messages = [m for m in messages if isinstance(m, dict) and m.get("role") == "tool"]
+        assert tool_messages[0]["content"] == tool_messages[1]["content"]
+
+    def test_reworded_explanation_reuses_result(self):
+        """Only the SQL keys a query_database call, not its free-text explanation."""
+        sql = "SELECT COUNT(*) AS n FROM restaurants LIMIT 1"
+        completions = [
+            _completion(tool_calls=[_tool_call("call_1", "query_database", {"sql": sql, "explanation": "Count them"})]),
+            _completion(tool_calls=[_tool_call("call_2", "query_database", {"sql": sql, "explanation": "Recount"})]),
+            _completion(content="There are 1"),
+        ]
+        with patch.object(llm_orchestrator, "invoke_query_data") as query_data, \
+                patch.object(llm_orchestrator, "invoke_response_validator") as validator:
+            query_data.return_value = QueryDataResult(True, [{"n": 1}], ["n"], 1, "| n |", sql)
+            validator.return_value = SimpleNamespace(
+                validated_response="There are 1", confidence_score=1.0, action="PASS"
+            )
+            result, _ = _run(completions)
+
+        assert query_data.call_count == 1
+        assert result.metadata["tools_used"][:2] == ["query_database", "query_database:cached"]
+
+
+class TestBusyPools:
+    """Tests for falling back to the request thread when a shared pool is busy."""
+
+    def test_busy_pool_runs_inline(self):
+        """With no free worker, work runs on the caller's thread instead of queueing."""
+        slots = threading.BoundedSemaphore(1)
+        release = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            busy = llm_orchestrator._try_submit(executor, slots, release.wait, 5)
+            assert busy is not None
+            assert llm_orchestrator._try_submit(executor, slots, int) is None
+            release.set()
+            busy.result()
+            # The slot is released by a done callback that may run just after result()
+            assert slots.acquire(timeout=5)
+            slots.release()
+            follow_up = llm_orchestrator._try_submit(executor, slots, int, "7")
+            assert follow_up is not None and follow_up.result() == 7
+
+
+class TestHybridSearch:
+    """Tests for adding semantic results to sparse content queries."""
+
+    def _run_query(self, sql, rows):
+        data = [{"name": f"r{i}"} for i in range(rows)]
+        with patch.object(llm_orchestrator, "invoke_query_data") as query_data, \
+                patch.object(llm_orchestrator, "invoke_vector_search") as vector_search:
+            query_data.return_value = QueryDataResult(True, data, ["name"], rows, "| name |", sql)
+            vector_search.return_value = VectorSearchResult(True, [{"content": "vegan"}], "vegan")
+            result = LLMOrchestrator()._run_query_database(
+                {"sql": sql}, "Show me vegan restaurants", 0.0
+            )
+        return result, vector_search
+
+    def test_dense_result_skips_search(self):
+        """More than 5 SQL rows: the knowledge base is never queried."""
+        result, vector_search = self._run_query("SELECT name FROM restaurants LIMIT 50", 10)
+
+        vector_search.assert_not_called()
+        assert "semantic_results" not in result.result
+        # Exact values for every row the model may cite, not just the first five
+        assert len(result.result["sample_rows"]) == 10
+        assert "abbreviates numbers" in result.result["result_summary"]
+
+    def test_sparse_result_adds_search(self):
+        """Few SQL rows: semantic results are added after the row count is known."""
+        result, vector_search = self._run_query("SELECT name FROM restaurants LIMIT 50", 2)
+
+        vector_search.assert_called_once()
+        assert result.result["semantic_results"] == [{"content": "vegan"}]
+
+    def test_small_limit_starts_search_alongside_sql(self):
+        """A LIMIT of 5 or less guarantees a sparse result, so the search overlaps SQL."""
+        with patch.object(llm_orchestrator, "_hybrid_executor") as executor, \
+                patch.object(llm_orchestrator, "_hybrid_slots", threading.BoundedSemaphore(1)):
+            executor.submit.return_value.result.return_value = VectorSearchResult(
+                True, [{"content": "vegan"}], "vegan"
+            )
+            result, vector_search = self._run_query("SELECT name FROM restaurants LIMIT 3", 3)
+
+        executor.submit.assert_called_once()
+        vector_search.assert_not_called()
+        assert result.result["semantic_results"] == [{"content": "vegan"}]
+
+
+class TestValidationSkip:
+    """Tests for skipping the validator on claim-free answers."""
+
+    def _run_with_answer(self, answer):
+        completions = [
+            _completion(tool_calls=[_tool_call("call_sql", "query_database", {"sql": "SELECT 1 AS n LIMIT 1"})]),
+            _completion(content=answer),
+        ]
+        with patch.object(llm_orchestrator, "invoke_query_data") as query_data, \
+                patch.object(llm_orchestrator, "invoke_response_validator") as validator:
+            query_data.return_value = QueryDataResult(True, [], ["n"], 0, "", "SELECT 1 AS n LIMIT 1")
+            validator.return_value = SimpleNamespace(
+                validated_response=answer, confidence_score=0.9, action="PASS"
+            )
+            result, _ = _run(completions)
+        return result, validator
+
+    def test_trivial_answer_skips_validator(self):
+        """A short answer with no numbers, tables, handles or names is not validated."""
+        result, validator = self._run_with_answer("No results found.")
+
+        assert validator.call_count == 0
+        assert result.metadata["validation_status"] == "SKIP_TRIVIAL"
+        assert "response_validator" not in result.metadata["tools_used"]
+
+    def test_answer_with_claims_is_validated(self):
+        """Numbers in the answer still go through the validator."""
+        result, validator = self._run_with_answer("There are 42 restaurants.")
+
+        assert validator.call_count == 1
+        assert result.metadata["validation_status"] == "PASS"
+
+
+class TestHelpFastPath:
+    """Tests for answering greetings and help requests without the LLM."""
+
+    def test_greeting_skips_llm(self):
+        """A bare greeting is served from the static help text."""
+        result, client = _run([], user_message="Hello!")
+
+        assert result.response == get_help_response("greeting")
+        assert result.metadata["tools_used"] == ["get_help_info"]
+        assert client.chat.completions.create.call_count == 0
+
+    def test_help_question_with_content_uses_llm(self):
+        """Only whole-message matches take the fast path."""
+        result, client = _run([_completion(content="Sure")], user_message="help me find vegan places")
+
+        assert result.response == "Sure"
+        assert client.chat.completions.create.call_count == 1
+
+
+class TestLLMCache:
+    """Tests for the exact-match completion cache."""
+
+    def test_identical_request_skips_llm_call(self):
+        """A repeated no-tool conversation is answered from the cache."""
+        first, client = _run([_completion(content="Hi there")])
+        second, second_client = _run([_completion(content="unused")])
+
+        assert first.response == second.response == "Hi there"
+        assert second_client.chat.completions.create.call_count == 0
+
+    def test_different_conversation_misses_cache(self):
+        """Any change in the messages produces a new LLM call."""
+        _run([_completion(content="Hi there")])
+        result, client = _run([_completion(content="Other")], user_message="Something else")
+
+        assert result.response == "Other"
+        assert client.chat.completions.create.call_count == 1
+
+    def test_failed_run_is_not_cached(self):
+        """After a max-iterations failure the same request calls the LLM again."""
+        call = {"sql": "SELECT COUNT(*) AS n FROM restaurants LIMIT 1"}
+        looping = [
+            _completion(tool_calls=[_tool_call(f"call_{i}", "query_database", call)])
+            for i in range(llm_orchestrator.MAX_ITERATIONS)
+        ]
+        with patch.object(llm_orchestrator, "invoke_query_data") as query_data:
+            query_data.return_value = QueryDataResult(True, [{"n": 1}], ["n"], 1, "| n |", call["sql"])
+            first, _ = _run(looping)
+            second, client = _run(list(looping))
+
+        assert first.error == second.error == "Max iterations reached"
+        assert client.chat.completions.create.call_count == llm_orchestrator.MAX_ITERATIONS
@@ -0,0 +1,75 @@
+"""
+Tests for the orchestrator response cache.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Orchestrator modules import each other flat (as packaged for Lambda)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import handler
+from handler import ChatRequest, process_chat
+from llm_orchestrator import OrchestrationResult
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    handler._response_cache.clear()
+    yield
+    handler._response_cache.clear()
+
+
+def _result(text="ok", error=None):
+    return OrchestrationResult(response=text, metadata={}, error=error)
+
+
+class TestResponseCache:
+    """Tests for process_chat response caching."""
+
+    def test_repeat_question_is_served_from_cache(self):
+        """Same first-turn question (modulo case/whitespace) hits the LLM once."""
+        with patch.object(handler.LLMOrchestrator, "orchestrate", return_value=_result()) as orchestrate:
+            first = process_chat(ChatRequest(message="Top 5 restaurants", conversation_history=[]))
+            second = process_chat(ChatRequest(message="  top 5   RESTAURANTS ", conversation_history=[]))
+
+        assert orchestrate.call_count == 1
+        assert second is first
+
+    def test_sentence_punctuation_is_ignored(self):
+        """Trailing punctuation does not split cache entries, numbers keep theirs."""
+        with patch.object(handler.LLMOrchestrator, "orchestrate", return_value=_result()) as orchestrate:
+            process_chat(ChatRequest(message="Restaurants rated above 4.5", conversation_history=[]))
+            process_chat(ChatRequest(message="restaurants rated above 4.5?!", conversation_history=[]))
+            process_chat(ChatRequest(message="restaurants rated above 45", conversation_history=[]))
+
+        assert orchestrate.call_count == 2
+
+    def test_follow_up_turns_are_not_cached(self):
+        """Requests with conversation history always reach the orchestrator."""
+        history = [{"role": "user", "content": "hi"}]
+        with patch.object(handler.LLMOrchestrator, "orchestrate", return_value=_result()) as orchestrate:
+            process_chat(ChatRequest(message="and posts?", conversation_history=history))
+            process_chat(ChatRequest(message="and posts?", conversation_history=history))
+
+        assert orchestrate.call_count == 2
+
+    def test_errors_are_not_cached(self):
+        """A failed answer is retried on the next identical question."""
+        with patch.object(handler.LLMOrchestrator, "orchestrate", return_value=_result(error="boom")) as orchestrate:
+            process_chat(ChatRequest(message="help", conversation_history=[]))
+            process_chat(ChatRequest(message="help", conversation_history=[]))
+
+        assert orchestrate.call_count == 2
+
+    def test_expired_entries_are_evicted(self):
+        """Entries older than the TTL are recomputed."""
+        with patch.object(handler.LLMOrchestrator, "orchestrate", return_value=_result()) as orchestrate, \
+                patch.object(handler._response_cache, "ttl_seconds", -1):
+            process_chat(ChatRequest(message="help", conversation_history=[]))
+            process_chat(ChatRequest(message="help", conversation_history=[]))
+
+        assert orchestrate.call_count == 2
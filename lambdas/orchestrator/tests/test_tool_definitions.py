@@ -0,0 +1,39 @@
+"""
+Tests for tool call validation.
+"""
+
+import sys
+from pathlib import Path
+
+# Orchestrator modules import each other flat (as packaged for Lambda)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tool_definitions import validate_tool_call, TOOL_QUERY_DATABASE
+
+
+class TestValidateQueryDatabase:
+    """Tests for query_database SQL checks."""
+
+    def test_columns_containing_keywords_are_allowed(self):
+        """created_at / updated_at are not forbidden keywords."""
+        is_valid, error = validate_tool_call(
+            TOOL_QUERY_DATABASE,
+            {"sql": "SELECT created_at, updated_at FROM posts ORDER BY created_at DESC LIMIT 5"},
+        )
+        assert is_valid
+        assert error == ""
+
+    def test_forbidden_keyword_is_rejected(self):
+        """A standalone write keyword is rejected and named."""
+        is_valid, error = validate_tool_call(
+            TOOL_QUERY_DATABASE,
+            {"sql": "select 1; drop table posts"},
+        )
+        assert not is_valid
+        assert error == "Query contains forbidden keyword: DROP"
+
+    def test_non_select_is_rejected(self):
+        """Only SELECT statements are accepted."""
+        is_valid, error = validate_tool_call(TOOL_QUERY_DATABASE, {"sql": "WITH x AS (SELECT 1) SELECT * FROM x"})
+        assert not is_valid
+        assert error == "Only SELECT queries are allowed"
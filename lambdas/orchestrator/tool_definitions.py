@@ -5,84 +5,90 @@ Defines the tools available to the LLM orchestrator using OpenAI's function call
 Tool descriptions are pulled from prompts.py for centralized management.
 """
 
-from prompts import get_prompt
+import re
+
+from prompts import get_prompt, HELP_TOPICS
 
 # =============================================================================
 # TOOL DEFINITIONS FOR OPENAI FUNCTION CALLING
 # =============================================================================
 
-def get_tool_definitions() -> list:
-    """
-    Get the list of tool definitions for OpenAI function calling.
-
-    Returns:
-        List of tool definition dicts in OpenAI format
-    """
-    return [
-        {
-            "type": "function",
-            "function": {
-                "name": "query_database",
-                "description": get_prompt("tool_descriptions", "query_database"),
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "sql": {
-                            "type": "string",
-                            "description": "The SQL SELECT query to execute. Must be a valid SELECT statement with appropriate LIMIT clause."
-                        },
-                        "explanation": {
-                            "type": "string",
-                            "description": "Brief explanation of what this query retrieves and why it answers the user's question."
-                        }
+# Static, so built once at import; callers must not mutate it
+_TOOL_DEFINITIONS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "query_database",
+            "description": get_prompt("tool_descriptions", "query_database"),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "sql": {
+                        "type": "string",
+                        "description": "The SQL SELECT query to execute. Must be a valid SELECT statement with appropriate LIMIT clause."
                     },
-                    "required": ["sql", "explanation"]
-                }
+                    "explanation": {
+                        "type": "string",
+                        "description": "Brief explanation of what this query retrieves and why it answers the user's question."
+                    }
+                },
+                "required": ["sql", "explanation"]
             }
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "search_knowledge_base",
-                "description": get_prompt("tool_descriptions", "search_knowledge_base"),
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Natural language search query describing what to find. Should describe features, atmosphere, or characteristics."
-                        },
-                        "top_k": {
-                            "type": "integer",
-                            "description": "Number of results to return. Default is 5, maximum is 10.",
-                            "default": 5,
-                            "minimum": 1,
-                            "maximum": 10
-                        }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "search_knowledge_base",
+            "description": get_prompt("tool_descriptions", "search_knowledge_base"),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Natural language search query describing what to find. Should describe features, atmosphere, or characteristics."
                     },
-                    "required": ["query"]
-                }
+                    "top_k": {
+                        "type": "integer",
+                        "description": "Number of results to return. Default is 5, maximum is 10.",
+                        "default": 5,
+                        "minimum": 1,
+                        "maximum": 10
+                    }
+                },
+                "required": ["query"]
             }
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "get_help_info",
-                "description": get_prompt("tool_descriptions", "get_help_info"),
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "topic": {
-                            "type": "string",
-                            "description": "Help topic to retrieve information about.",
-                            "enum": ["general", "sql_queries", "semantic_search", "greeting"]
-                        }
-                    },
-                    "required": ["topic"]
-                }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_help_info",
+            "description": get_prompt("tool_descriptions", "get_help_info"),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "topic": {
+                        "type": "string",
+                        "description": "Help topic to retrieve information about.",
+                        "enum": ["general", "sql_queries", "semantic_search", "greeting"]
+                    }
+                },
+                "required": ["topic"]
             }
         }
-    ]
+    }
+]
+
+
+def get_tool_definitions() -> list:
+    """
+    Get the list of tool definitions for OpenAI function calling.
+
+    Returns:
+        List of tool definition dicts in OpenAI format (shared, read-only)
+    """
+    return _TOOL_DEFINITIONS
 
 
 # =============================================================================
@@ -93,11 +99,18 @@ TOOL_QUERY_DATABASE = "query_database"
 TOOL_SEARCH_KNOWLEDGE_BASE = "search_knowledge_base"
 TOOL_GET_HELP_INFO = "get_help_info"
 
-ALL_TOOL_NAMES = [
+ALL_TOOL_NAMES = frozenset({
     TOOL_QUERY_DATABASE,
     TOOL_SEARCH_KNOWLEDGE_BASE,
     TOOL_GET_HELP_INFO,
-]
+})
+
+VALID_HELP_TOPICS = frozenset(HELP_TOPICS)
+
+# Whole-word match, so columns like created_at / updated_at are not rejected
+FORBIDDEN_SQL_KEYWORDS_RE = re.compile(
+    r"\b(DROP|DELETE|UPDATE|INSERT|ALTER|TRUNCATE|CREATE)\b", re.IGNORECASE
+)
 
 
 # =============================================================================
@@ -109,6 +122,47 @@ def is_valid_tool_name(name: str) -> bool:
     return name in ALL_TOOL_NAMES
 
 
+def _validate_query_database(arguments: dict) -> tuple[bool, str]:
+    """Validate query_database arguments."""
+    if "sql" not in arguments:
+        return False, "Missing required parameter: sql"
+    sql = arguments["sql"]
+    # Only the leading keyword needs uppercasing, not the whole query
+    if sql.lstrip()[:6].upper() != "SELECT":
+        return False, "Only SELECT queries are allowed"
+    # Check for dangerous keywords (the pattern is case-insensitive)
+    match = FORBIDDEN_SQL_KEYWORDS_RE.search(sql)
+    if match:
+        return False, f"Query contains forbidden keyword: {match.group(1).upper()}"
+    return True, ""
+
+
+def _validate_search_knowledge_base(arguments: dict) -> tuple[bool, str]:
+    """Validate search_knowledge_base arguments."""
+    if "query" not in arguments:
+        return False, "Missing required parameter: query"
+    if arguments.get("top_k", 5) > 10:
+        return False, "top_k cannot exceed 10"
+    return True, ""
+
+
+def _validate_get_help_info(arguments: dict) -> tuple[bool, str]:
+    """Validate get_help_info arguments."""
+    if "topic" not in arguments:
+        return False, "Missing required parameter: topic"
+    if arguments["topic"] not in VALID_HELP_TOPICS:
+        return False, f"Invalid topic. Must be one of: {list(HELP_TOPICS)}"
+    return True, ""
+
+
+# Tool name -> argument validator
+_VALIDATORS = {
+    TOOL_QUERY_DATABASE: _validate_query_database,
+    TOOL_SEARCH_KNOWLEDGE_BASE: _validate_search_knowledge_base,
+    TOOL_GET_HELP_INFO: _validate_get_help_info,
+}
+
+
 def validate_tool_call(tool_name: str, arguments: dict) -> tuple[bool, str]:
     """
     Validate a tool call's arguments.
@@ -120,32 +174,7 @@ def validate_tool_call(tool_name: str, arguments: dict) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not is_valid_tool_name(tool_name):
+    validator = _VALIDATORS.get(tool_name)
+    if validator is None:
         return False, f"Unknown tool: {tool_name}"
-
-    if tool_name == TOOL_QUERY_DATABASE:
-        if "sql" not in arguments:
-            return False, "Missing required parameter: sql"
-        sql = arguments["sql"].strip().upper()
-        if not sql.startswith("SELECT"):
-            return False, "Only SELECT queries are allowed"
-        # Check for dangerous keywords
-        dangerous = ["DROP", "DELETE", "UPDATE", "INSERT", "ALTER", "TRUNCATE", "CREATE"]
-        for keyword in dangerous:
-            if keyword in sql:
-                return False, f"Query contains forbidden keyword: {keyword}"
-
-    elif tool_name == TOOL_SEARCH_KNOWLEDGE_BASE:
-        if "query" not in arguments:
-            return False, "Missing required parameter: query"
-        if arguments.get("top_k", 5) > 10:
-            return False, "top_k cannot exceed 10"
-
-    elif tool_name == TOOL_GET_HELP_INFO:
-        if "topic" not in arguments:
-            return False, "Missing required parameter: topic"
-        valid_topics = ["general", "sql_queries", "semantic_search", "greeting"]
-        if arguments["topic"] not in valid_topics:
-            return False, f"Invalid topic. Must be one of: {valid_topics}"
-
-    return True, ""
+    return validator(arguments)
@@ -11,9 +11,17 @@ from dataclasses import dataclass
 from typing import Any, Optional
 
 import boto3
+from botocore.config import Config
 
+import fast_json
 from config import (
     AWS_REGION,
+    AWS_MAX_POOL_CONNECTIONS,
+    AWS_CONNECT_TIMEOUT_SECONDS,
+    AWS_MAX_ATTEMPTS,
+    AWS_LAMBDA_READ_TIMEOUT_SECONDS,
+    AWS_KNOWLEDGE_BASE_READ_TIMEOUT_SECONDS,
+    S3_REGION,
     QUERY_DATA_LAMBDA,
     RESPONSE_VALIDATOR_LAMBDA,
     KNOWLEDGE_BASE_ID,
@@ -22,32 +30,60 @@ from config import (
 
 logger = logging.getLogger(__name__)
 
-# AWS Clients (lazy initialization)
-_lambda_client = None
-_bedrock_agent_client = None
+# AWS Clients (built during Lambda init so the first request doesn't pay for them)
+# Pooled keep-alive connections so parallel tool calls reuse TLS sessions
+_AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+    connect_timeout=AWS_CONNECT_TIMEOUT_SECONDS,
+    retries={'mode': 'adaptive', 'max_attempts': AWS_MAX_ATTEMPTS},
+    tcp_keepalive=True,
+)
+_lambda_client = boto3.client(
+    'lambda',
+    region_name=AWS_REGION,
+    config=_AWS_CLIENT_CONFIG.merge(Config(
+        read_timeout=AWS_LAMBDA_READ_TIMEOUT_SECONDS,
+        retries={'mode': 'standard', 'total_max_attempts': 1},
+    )),
+)
+_bedrock_agent_client = boto3.client(
+    'bedrock-agent-runtime',
+    region_name=AWS_REGION,
+    config=_AWS_CLIENT_CONFIG.merge(Config(read_timeout=AWS_KNOWLEDGE_BASE_READ_TIMEOUT_SECONDS)),
+)
+# Local DuckDB connection for query_data_direct (lazy initialization)
+_duckdb_conn = None
 
 
 def get_lambda_client():
-    """Get or create Lambda client."""
-    global _lambda_client
-    if _lambda_client is None:
-        _lambda_client = boto3.client('lambda', region_name=AWS_REGION)
+    """Get the Lambda client."""
     return _lambda_client
 
 
 def get_bedrock_agent_client():
-    """Get or create Bedrock Agent Runtime client."""
-    global _bedrock_agent_client
-    if _bedrock_agent_client is None:
-        _bedrock_agent_client = boto3.client('bedrock-agent-runtime', region_name=AWS_REGION)
+    """Get the Bedrock Agent Runtime client."""
     return _bedrock_agent_client
 
 
+def get_duckdb_connection():
+    """Get or create the local DuckDB connection (httpfs loaded once)."""
+    global _duckdb_conn
+    if _duckdb_conn is None:
+        import duckdb
+
+        conn = duckdb.connect()
+        conn.execute("SET home_directory='/tmp';")
+        conn.execute("INSTALL httpfs; LOAD httpfs;")
+        conn.execute(f"SET s3_region='{S3_REGION}';")
+        _duckdb_conn = conn
+    return _duckdb_conn
+
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class QueryDataResult:
     """Result from query_data tool."""
     success: bool
@@ -61,7 +97,7 @@ class QueryDataResult:
     allowed_values: Optional[dict] = None  # For simplified anti-hallucination
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorSearchResult:
     """Result from vector_search tool."""
     success: bool
@@ -70,7 +106,7 @@ class VectorSearchResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result from response_validator tool."""
     action: str  # PASS, SANITIZE, BLOCK
@@ -115,9 +151,10 @@ def extract_from_bedrock_response(response_payload: dict) -> dict:
 
         # Parse the JSON string
         if isinstance(body_str, str):
-            return json.loads(body_str)
+            return fast_json.loads(body_str)
         return body_str
 
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
     except (json.JSONDecodeError, KeyError, TypeError) as e:
         logger.error(f"Failed to extract from Bedrock response: {e}")
         logger.debug(f"Response payload: {response_payload}")
@@ -159,11 +196,11 @@ def invoke_query_data(sql: str, user_query: Optional[str] = None) -> QueryDataRe
         response = client.invoke(
             FunctionName=QUERY_DATA_LAMBDA,
             InvocationType='RequestResponse',
-            Payload=json.dumps(payload)
+            Payload=fast_json.dumps(payload)
         )
 
         # Parse response
-        response_payload = json.loads(response['Payload'].read())
+        response_payload = fast_json.loads(response['Payload'].read())
 
         # Extract from Bedrock format
         body = extract_from_bedrock_response(response_payload)
@@ -302,7 +339,7 @@ def invoke_response_validator(
         if allowed_values:
             parameters.append({
                 'name': 'allowed_values',
-                'value': json.dumps(allowed_values)
+                'value': fast_json.dumps(allowed_values)
             })
 
         payload = {
@@ -314,11 +351,11 @@ def invoke_response_validator(
         response = client.invoke(
             FunctionName=RESPONSE_VALIDATOR_LAMBDA,
             InvocationType='RequestResponse',
-            Payload=json.dumps(payload)
+            Payload=fast_json.dumps(payload)
         )
 
         # Parse response
-        response_payload = json.loads(response['Payload'].read())
+        response_payload = fast_json.loads(response['Payload'].read())
 
         # Extract from Bedrock format
         body = extract_from_bedrock_response(response_payload)
@@ -355,17 +392,13 @@ def query_data_direct(sql: str) -> QueryDataResult:
     Execute SQL query directly using DuckDB (for local testing).
     Bypasses Lambda invocation.
     """
-    import duckdb
-    from .config import S3_REGION, TABLE_SCHEMAS
-
     # This is a simplified version for local testing
     # In production, use invoke_query_data
 
     try:
-        conn = duckdb.connect()
-        conn.execute("SET home_directory='/tmp';")
-        conn.execute("INSTALL httpfs; LOAD httpfs;")
-        conn.execute(f"SET s3_region='{S3_REGION}';")
+        # A cursor per call shares the cached database but is safe to use
+        # from concurrent tool calls
+        conn = get_duckdb_connection().cursor()
 
         # For local testing, you would need to set up views
         # This is just a placeholder
@@ -29,6 +29,7 @@ logger.setLevel(logging.INFO)
 # Environment
 ANALYTICS_BUCKET = os.environ.get('ANALYTICS_BUCKET', 'instagram-analytics-lake')
 S3_REGION = os.environ.get('S3_REGION', 'us-east-1')
+DUCKDB_THREADS = int(os.environ.get('DUCKDB_THREADS', os.cpu_count() or 4))
 
 # Declarative Schema Definition
 TABLES = {
@@ -99,15 +100,27 @@ REQUIRED_PATTERNS = [
     (r"^\s*SELECT\b", "Query must start with SELECT"),
 ]
 
+# Compiled once at import. Valid queries (the common case) pay a single scan
+# for all blocked patterns; the per-pattern list is only walked to report
+# the first rule (in declaration order) that a rejected query broke.
+_BLOCKED_RES = [(re.compile(p, re.IGNORECASE), p, m) for p, m in BLOCKED_PATTERNS]
+_ANY_BLOCKED_RE = re.compile("|".join(f"(?:{p})" for p, _ in BLOCKED_PATTERNS), re.IGNORECASE)
+_REQUIRED_RES = [(re.compile(p, re.IGNORECASE), m) for p, m in REQUIRED_PATTERNS]
+_LIMIT_RE = re.compile(r"\bLIMIT\s+(\d+)", re.IGNORECASE)
+
 # Query limits
 MAX_ROWS = 1000
 DEFAULT_LIMIT = 100
 
+# Lazy-loaded DuckDB connection and the views already created on it
+_conn = None
+_created_views: set[str] = set()
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult:
     """Result of a SQL query execution."""
     success: bool
@@ -118,7 +131,7 @@ class QueryResult:
     columns: list | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of SQL validation."""
     valid: bool
@@ -142,33 +155,28 @@ def validate_sql(sql: str) -> ValidationResult:
     sql_upper = sql_normalized.upper()
 
     # Check blocked patterns
-    for pattern, message in BLOCKED_PATTERNS:
-        if re.search(pattern, sql_upper, re.IGNORECASE):
-            logger.warning(f"Blocked SQL pattern detected: {pattern}")
-            return ValidationResult(valid=False, error=message)
+    if _ANY_BLOCKED_RE.search(sql_upper):
+        for regex, pattern, message in _BLOCKED_RES:
+            if regex.search(sql_upper):
+                logger.warning(f"Blocked SQL pattern detected: {pattern}")
+                return ValidationResult(valid=False, error=message)
 
     # Check required patterns
-    for pattern, message in REQUIRED_PATTERNS:
-        if not re.search(pattern, sql_upper, re.IGNORECASE):
+    for regex, message in _REQUIRED_RES:
+        if not regex.search(sql_upper):
             return ValidationResult(valid=False, error=message)
 
     # Ensure LIMIT exists (add if missing)
-    if not re.search(r"\bLIMIT\s+\d+", sql_upper):
+    limit_match = _LIMIT_RE.search(sql_normalized)
+    if not limit_match:
         sql_normalized = f"{sql_normalized.rstrip(';')} LIMIT {DEFAULT_LIMIT}"
         logger.info(f"Added default LIMIT {DEFAULT_LIMIT}")
 
     # Cap LIMIT if too high
-    limit_match = re.search(r"\bLIMIT\s+(\d+)", sql_normalized, re.IGNORECASE)
-    if limit_match:
+    elif int(limit_match.group(1)) > MAX_ROWS:
         limit_val = int(limit_match.group(1))
-        if limit_val > MAX_ROWS:
-            sql_normalized = re.sub(
-                r"\bLIMIT\s+\d+",
-                f"LIMIT {MAX_ROWS}",
-                sql_normalized,
-                flags=re.IGNORECASE
-            )
-            logger.info(f"Capped LIMIT from {limit_val} to {MAX_ROWS}")
+        sql_normalized = _LIMIT_RE.sub(f"LIMIT {MAX_ROWS}", sql_normalized)
+        logger.info(f"Capped LIMIT from {limit_val} to {MAX_ROWS}")
 
     return ValidationResult(valid=True, sanitized_sql=sql_normalized)
 
@@ -183,22 +191,50 @@ def init_duckdb() -> duckdb.DuckDBPyConnection:
     conn.execute("SET home_directory='/tmp';")
     conn.execute("INSTALL httpfs; LOAD httpfs;")
     conn.execute(f"SET s3_region='{S3_REGION}';")
+    # Cut S3 round-trips: keep connections alive, cache Parquet footers, and
+    # prefetch/coalesce row-group reads. The connection outlives a single
+    # invocation, so the HTTP metadata cache stays at its per-query default:
+    # each query re-checks object size/last-modified, and the footer cache
+    # reloads any file that was rewritten since it was cached.
+    conn.execute("SET http_keep_alive=true;")
+    conn.execute("SET parquet_metadata_cache=true;")
+    conn.execute("SET prefetch_all_parquet_files=true;")
+    # S3 scans are I/O bound; don't leave Lambda vCPUs idle
+    conn.execute(f"SET threads={DUCKDB_THREADS};")
     logger.info("DuckDB initialized with httpfs extension")
     return conn
 
 
+def _get_connection() -> duckdb.DuckDBPyConnection:
+    """
+    Get or create DuckDB connection.
+    Caches connection for reuse within Lambda execution context, so warm
+    invocations skip INSTALL/LOAD httpfs.
+    """
+    global _conn
+
+    if _conn is None:
+        _conn = init_duckdb()
+    return _conn
+
+
 def build_table_views(conn: duckdb.DuckDBPyConnection) -> None:
     """
     Declaratively create views for each table from TABLES config.
     This allows queries to use simple table names instead of read_parquet().
+    Views persist on the cached connection, so each is created once per
+    execution context; tables that failed (no data yet) are retried.
     """
     for table_name, config in TABLES.items():
+        if table_name in _created_views:
+            continue
         try:
             view_sql = f"""
                 CREATE OR REPLACE VIEW {table_name} AS
                 SELECT * FROM read_parquet('{config['path']}')
             """
             conn.execute(view_sql)
+            _created_views.add(table_name)
             logger.info(f"Created view: {table_name}")
         except Exception as e:
             # Handle case where table has no data yet (e.g., query_logs)
@@ -244,8 +280,8 @@ def execute_query(sql: str, user_query: str | None = None) -> QueryResult:
     logger.info(f"Executing SQL: {safe_sql}")
 
     try:
-        # Initialize DuckDB and create views
-        conn = init_duckdb()
+        # Reuse the warm DuckDB connection and create views
+        conn = _get_connection()
         build_table_views(conn)
 
         # Execute query
@@ -328,6 +364,47 @@ def format_number(value: any) -> str:
         return f"{value:,}" if isinstance(value, int) else f"{value:.2f}"
 
 
+# Human-readable table headers
+HEADER_MAP = {
+    'restaurant_name': 'Restaurant',
+    'instagram_handle': 'Handle',
+    'followers': 'Followers',
+    'posts_count': 'Posts',
+    'search_term': 'Hashtag',
+    'post_id': 'Post ID',
+    'creator': 'Creator',
+    'posted_date': 'Date',
+    'likes': 'Likes',
+    'comments': 'Comments',
+    'hashtags': 'Hashtags',
+    'caption': 'Caption',
+    'city': 'City',
+    'zip_code': 'ZIP',
+    'phone': 'Phone',
+    'bio': 'Bio',
+    'website': 'Website',
+    'status': 'Status',
+    'avg_likes': 'Avg Likes',
+    'avg_comments': 'Avg Comments',
+    'total_likes': 'Total Likes',
+    'count': 'Count',
+}
+
+# Numeric columns that should be formatted with K/M suffixes
+NUMERIC_COLUMNS = {'followers', 'posts_count', 'likes', 'comments', 'avg_likes',
+                   'avg_comments', 'total_likes', 'count'}
+
+
+def format_text_cell(value: any) -> str:
+    """Truncate long text and escape pipe characters for a table cell."""
+    if value is None:
+        return ""
+    str_val = str(value)
+    if len(str_val) > 50:
+        str_val = str_val[:47] + "..."
+    return str_val.replace("|", "\\|")
+
+
 def format_as_markdown_table(columns: list, data: list) -> str:
     """
     Format query results as a markdown table.
@@ -336,67 +413,23 @@ def format_as_markdown_table(columns: list, data: list) -> str:
     if not data or not columns:
         return "No data found."
 
-    # Create human-readable headers
-    header_map = {
-        'restaurant_name': 'Restaurant',
-        'instagram_handle': 'Handle',
-        'followers': 'Followers',
-        'posts_count': 'Posts',
-        'search_term': 'Hashtag',
-        'post_id': 'Post ID',
-        'creator': 'Creator',
-        'posted_date': 'Date',
-        'likes': 'Likes',
-        'comments': 'Comments',
-        'hashtags': 'Hashtags',
-        'caption': 'Caption',
-        'city': 'City',
-        'zip_code': 'ZIP',
-        'phone': 'Phone',
-        'bio': 'Bio',
-        'website': 'Website',
-        'status': 'Status',
-        'avg_likes': 'Avg Likes',
-        'avg_comments': 'Avg Comments',
-        'total_likes': 'Total Likes',
-        'count': 'Count',
-    }
-
     # Format headers
-    headers = [header_map.get(col.lower(), col.replace('_', ' ').title()) for col in columns]
-
-    # Numeric columns that should be formatted
-    numeric_cols = {'followers', 'posts_count', 'likes', 'comments', 'avg_likes',
-                    'avg_comments', 'total_likes', 'count'}
-
-    # Build table
-    lines = []
-
-    # Header row
-    lines.append("| " + " | ".join(headers) + " |")
-
-    # Separator row
-    lines.append("|" + "|".join(["---" for _ in headers]) + "|")
-
-    # Data rows
-    for row in data:
-        cells = []
-        for col in columns:
-            value = row.get(col, "")
-            # Format numeric columns
-            if col.lower() in numeric_cols:
-                cells.append(format_number(value))
-            elif value is None:
-                cells.append("")
-            else:
-                # Truncate long text
-                str_val = str(value)
-                if len(str_val) > 50:
-                    str_val = str_val[:47] + "..."
-                # Escape pipe characters
-                str_val = str_val.replace("|", "\\|")
-                cells.append(str_val)
-        lines.append("| " + " | ".join(cells) + " |")
+    headers = [HEADER_MAP.get(col.lower(), col.replace('_', ' ').title()) for col in columns]
+
+    # Pick each column's cell formatter once, not per cell
+    column_formatters = [
+        (col, format_number if col.lower() in NUMERIC_COLUMNS else format_text_cell)
+        for col in columns
+    ]
+
+    lines = [
+        "| " + " | ".join(headers) + " |",
+        "|" + "|".join(["---" for _ in headers]) + "|",
+    ]
+    lines.extend(
+        "| " + " | ".join(fmt(row.get(col, "")) for col, fmt in column_formatters) + " |"
+        for row in data
+    )
 
     return "\n".join(lines)
 
@@ -468,6 +501,10 @@ def extract_restaurant_handles(data: list, columns: list) -> list:
     return handles[:20]  # Limit to first 20 for metadata
 
 
+# Table names as whole words, so posts_count is not mistaken for the posts table
+_SCOPE_TABLE_RE = re.compile(r"\b(posts|restaurants)\b", re.IGNORECASE)
+
+
 def determine_query_scope(sql: str) -> str:
     """
     Determine the scope of the query based on tables referenced.
@@ -481,10 +518,9 @@ def determine_query_scope(sql: str) -> str:
     if not sql:
         return "unknown"
 
-    sql_upper = sql.upper()
-
-    has_posts = 'POSTS' in sql_upper and 'POSTS_COUNT' not in sql_upper
-    has_restaurants = 'RESTAURANTS' in sql_upper
+    tables = {name.lower() for name in _SCOPE_TABLE_RE.findall(sql)}
+    has_posts = 'posts' in tables
+    has_restaurants = 'restaurants' in tables
 
     if has_posts and has_restaurants:
         return "posts_and_restaurants"
@@ -613,19 +649,25 @@ def build_allowed_values(result: 'QueryResult') -> dict:
 # SCHEMA INTROSPECTION (for agent)
 # =============================================================================
 
+def _iter_schema_lines():
+    """Yield the lines of the schema description."""
+    yield "Available tables and columns:\n"
+    for table_name, config in TABLES.items():
+        yield f"\n## {table_name}"
+        for col_name, col_type, col_desc in config["columns"]:
+            yield f"  - {col_name} ({col_type}): {col_desc}"
+
+
+# TABLES is static, so the description is built once at import
+SCHEMA_DESCRIPTION = "\n".join(_iter_schema_lines())
+
+
 def get_schema_description() -> str:
     """
     Generate human-readable schema description.
     This can be returned to help the agent understand available data.
     """
-    lines = ["Available tables and columns:\n"]
-
-    for table_name, config in TABLES.items():
-        lines.append(f"\n## {table_name}")
-        for col_name, col_type, col_desc in config["columns"]:
-            lines.append(f"  - {col_name} ({col_type}): {col_desc}")
-
-    return "\n".join(lines)
+    return SCHEMA_DESCRIPTION
 
 
 # =============================================================================
@@ -734,6 +776,29 @@ def format_bedrock_response(event: dict, result: QueryResult) -> dict:
     }
 
 
+def run_get_schema(params: dict, user_query: str | None) -> QueryResult:
+    """Return schema description to help agent."""
+    return QueryResult(
+        success=True,
+        data=[{'schema': get_schema_description()}],
+        error=None,
+        sql='',
+        row_count=1
+    )
+
+
+def run_execute_sql(params: dict, user_query: str | None) -> QueryResult:
+    """Execute the SQL query from the agent's parameters."""
+    return execute_query(params.get('sql', ''), user_query=user_query)
+
+
+# Action group functions, looked up by event['function']
+FUNCTIONS = {
+    'get_schema': run_get_schema,
+    'execute_sql': run_execute_sql,
+}
+
+
 def handler(event: dict, context: Any) -> dict:
     """
     Lambda handler for Bedrock Agent action group.
@@ -742,7 +807,7 @@ def handler(event: dict, context: Any) -> dict:
     - function: 'execute_sql' or 'get_schema'
     - parameters: [{'name': 'sql', 'value': 'SELECT ...'}]
     """
-    logger.info(f"Event received: {json.dumps(event)}")
+    logger.info("Event received: %s", event)
 
     try:
         function_name = event.get('function', 'execute_sql')
@@ -751,20 +816,9 @@ def handler(event: dict, context: Any) -> dict:
 
         logger.info(f"Function: {function_name}, Params: {params}, UserQuery: {user_query}")
 
-        if function_name == 'get_schema':
-            # Return schema description to help agent
-            schema = get_schema_description()
-            result = QueryResult(
-                success=True,
-                data=[{'schema': schema}],
-                error=None,
-                sql='',
-                row_count=1
-            )
-        elif function_name == 'execute_sql':
-            # Execute SQL query
-            sql = params.get('sql', '')
-            result = execute_query(sql, user_query=user_query)
+        function = FUNCTIONS.get(function_name)
+        if function:
+            result = function(params, user_query)
         else:
             result = QueryResult(
                 success=False,
@@ -83,32 +83,39 @@ def log_query(
         date_partition = now.strftime('%Y-%m-%d')
         columns_json = json.dumps(columns_returned)
 
-        # Escape single quotes in SQL query for safe insertion
-        safe_sql_query = sql_query.replace("'", "''")
-        safe_error = error_message.replace("'", "''") if error_message else None
-        safe_user_query = user_query.replace("'", "''") if user_query else None
-
         # Output path with date partitioning
         output_path = f"{QUERY_LOGS_PATH}/date={date_partition}/{query_id}.parquet"
 
-        # Create a single-row table and write to Parquet
+        # Create a single-row table and write to Parquet. User-controlled
+        # text is bound as parameters, so no quote escaping is needed and
+        # the statement text is identical for every call.
         insert_sql = f"""
             COPY (
                 SELECT
-                    '{query_id}' as query_id,
-                    '{timestamp}'::TIMESTAMP as timestamp,
-                    {f"'{safe_user_query}'" if safe_user_query else 'NULL'} as user_query,
-                    '{safe_sql_query}' as sql_query,
-                    {str(success).lower()} as success,
-                    {f"'{safe_error}'" if safe_error else 'NULL'} as error_message,
-                    {execution_time_ms} as execution_time_ms,
-                    {row_count} as row_count,
-                    '{columns_json}' as columns_returned
+                    $query_id::VARCHAR as query_id,
+                    $timestamp::TIMESTAMP as timestamp,
+                    $user_query::VARCHAR as user_query,
+                    $sql_query::VARCHAR as sql_query,
+                    $success::BOOLEAN as success,
+                    $error_message::VARCHAR as error_message,
+                    $execution_time_ms::INTEGER as execution_time_ms,
+                    $row_count::INTEGER as row_count,
+                    $columns_returned::VARCHAR as columns_returned
             )
-            TO '{output_path}' (FORMAT PARQUET)
+            TO '{output_path}' (FORMAT PARQUET, COMPRESSION ZSTD)
         """
 
-        conn.execute(insert_sql)
+        conn.execute(insert_sql, {
+            'query_id': query_id,
+            'timestamp': timestamp,
+            'user_query': user_query or None,
+            'sql_query': sql_query,
+            'success': success,
+            'error_message': error_message or None,
+            'execution_time_ms': execution_time_ms,
+            'row_count': row_count,
+            'columns_returned': columns_json,
+        })
 
         logger.info(f"Query logged to {output_path}: success={success}, time={execution_time_ms}ms, rows={row_count}")
         return True
@@ -39,6 +39,7 @@ logger.setLevel(logging.INFO)
 
 ANALYTICS_BUCKET = os.environ.get('ANALYTICS_BUCKET', 'instagram-analytics-lake')
 S3_REGION = os.environ.get('S3_REGION', 'us-east-1')
+DUCKDB_THREADS = int(os.environ.get('DUCKDB_THREADS', os.cpu_count() or 4))
 
 # Table definitions for DuckDB views
 TABLES = {
@@ -61,14 +62,25 @@ BLOCKED_PATTERNS = [
     (r"\bTRUNCATE\b", "TRUNCATE operations not allowed"),
 ]
 
+# Compiled once at import. Valid queries (the common case) pay a single scan
+# for all blocked patterns; the per-pattern list is only walked to report
+# the first rule (in declaration order) that a rejected query broke.
+_BLOCKED_RES = [(re.compile(p, re.IGNORECASE), m) for p, m in BLOCKED_PATTERNS]
+_ANY_BLOCKED_RE = re.compile("|".join(f"(?:{p})" for p, _ in BLOCKED_PATTERNS), re.IGNORECASE)
+_SELECT_RE = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+
 MAX_ROWS = 100  # Limit for validation queries
 
+# Lazy-loaded DuckDB connection and the views already created on it
+_conn = None
+_created_views: set[str] = set()
+
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of response validation."""
     action: str  # PASS, SANITIZE, BLOCK
@@ -79,7 +91,7 @@ class ValidationResult:
     details: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedClaims:
     """Claims extracted from LLM response."""
     post_ids: list
@@ -89,7 +101,7 @@ class ExtractedClaims:
     rankings: list  # "top", "best", etc. claims
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult:
     """Result from query execution."""
     success: bool
@@ -109,19 +121,45 @@ def init_duckdb() -> duckdb.DuckDBPyConnection:
     conn.execute("SET home_directory='/tmp';")
     conn.execute("INSTALL httpfs; LOAD httpfs;")
     conn.execute(f"SET s3_region='{S3_REGION}';")
+    # Cut S3 round-trips: keep connections alive, cache Parquet footers, and
+    # prefetch/coalesce row-group reads. The connection outlives a single
+    # invocation, so the HTTP metadata cache stays at its per-query default:
+    # each query re-checks object size/last-modified, and the footer cache
+    # reloads any file that was rewritten since it was cached.
+    conn.execute("SET http_keep_alive=true;")
+    conn.execute("SET parquet_metadata_cache=true;")
+    conn.execute("SET prefetch_all_parquet_files=true;")
+    # S3 scans are I/O bound; don't leave Lambda vCPUs idle
+    conn.execute(f"SET threads={DUCKDB_THREADS};")
     logger.info("DuckDB initialized with httpfs extension")
     return conn
 
 
+def _get_connection() -> duckdb.DuckDBPyConnection:
+    """
+    Get or create DuckDB connection.
+    Caches connection for reuse within Lambda execution context, so warm
+    invocations skip INSTALL/LOAD httpfs.
+    """
+    global _conn
+
+    if _conn is None:
+        _conn = init_duckdb()
+    return _conn
+
+
 def build_table_views(conn: duckdb.DuckDBPyConnection) -> None:
-    """Create views for each table from TABLES config."""
+    """Create views for each table from TABLES config (once per connection)."""
     for table_name, config in TABLES.items():
+        if table_name in _created_views:
+            continue
         try:
             view_sql = f"""
                 CREATE OR REPLACE VIEW {table_name} AS
                 SELECT * FROM read_parquet('{config['path']}')
             """
             conn.execute(view_sql)
+            _created_views.add(table_name)
             logger.info(f"Created view: {table_name}")
         except Exception as e:
             logger.warning(f"Could not create view for {table_name}: {e}")
@@ -132,13 +170,12 @@ def validate_sql(sql: str) -> tuple[bool, str | None]:
     if not sql or not sql.strip():
         return False, "Empty SQL query"
 
-    sql_upper = sql.upper()
+    if _ANY_BLOCKED_RE.search(sql):
+        for regex, message in _BLOCKED_RES:
+            if regex.search(sql):
+                return False, message
 
-    for pattern, message in BLOCKED_PATTERNS:
-        if re.search(pattern, sql_upper, re.IGNORECASE):
-            return False, message
-
-    if not re.search(r"^\s*SELECT\b", sql_upper, re.IGNORECASE):
+    if not _SELECT_RE.search(sql):
         return False, "Query must start with SELECT"
 
     return True, None
@@ -164,7 +201,7 @@ def execute_verification_query(sql: str) -> QueryResult:
         )
 
     try:
-        conn = init_duckdb()
+        conn = _get_connection()
         build_table_views(conn)
 
         # Add LIMIT if not present to prevent huge queries
@@ -232,15 +269,18 @@ def extract_post_ids_from_data(data: list, columns: list) -> list:
     return post_ids[:20]
 
 
+# Table names as whole words, so posts_count is not mistaken for the posts table
+_SCOPE_TABLE_RE = re.compile(r"\b(posts|restaurants)\b", re.IGNORECASE)
+
+
 def determine_query_scope(sql: str) -> str:
     """Determine the scope of the query based on tables referenced."""
     if not sql:
         return "unknown"
 
-    sql_upper = sql.upper()
-
-    has_posts = 'POSTS' in sql_upper and 'POSTS_COUNT' not in sql_upper
-    has_restaurants = 'RESTAURANTS' in sql_upper
+    tables = {name.lower() for name in _SCOPE_TABLE_RE.findall(sql)}
+    has_posts = 'posts' in tables
+    has_restaurants = 'restaurants' in tables
 
     if has_posts and has_restaurants:
         return "posts_and_restaurants"
@@ -332,8 +372,8 @@ def extract_post_ids(text: str) -> list:
     NOTE: Instagram post IDs typically start with 'C' followed by alphanumeric chars.
     We avoid matching Instagram handles (which follow @) or common words.
     """
-    # First, extract all @handles to exclude them from post ID matching
-    handles = set(re.findall(r'@([a-zA-Z0-9_\.]+)', text, re.IGNORECASE))
+    # First, extract all @handles (lowercased once) to exclude them from post ID matching
+    handles = {h.lower() for h in re.findall(r'@([a-zA-Z0-9_\.]+)', text, re.IGNORECASE)}
 
     patterns = [
         r'\bpost[_\s]?id[:\s]+([^\s,]+)',  # "post_id: XXX"
@@ -347,7 +387,7 @@ def extract_post_ids(text: str) -> list:
         matches = re.findall(pattern, text, re.IGNORECASE)
         for match in matches:
             # Exclude if it's a known handle
-            if match.lower() not in {h.lower() for h in handles}:
+            if match.lower() not in handles:
                 post_ids.append(match)
 
     return list(set(post_ids))
@@ -592,26 +632,34 @@ def validate_metrics(claimed_metrics: list, evidence_data: list, evidence_level:
 # RESPONSE SANITIZATION
 # =============================================================================
 
+def _alternation(values: list) -> str:
+    """Escaped regex alternation, longest first so overlapping values redact fully."""
+    return "|".join(re.escape(v) for v in sorted(set(values), key=len, reverse=True))
+
+
 def sanitize_response(response_text: str, invalid_claims: dict) -> str:
     """
     Remove or redact unverified claims from response.
+    Each claim type is redacted in a single pass over the text.
     """
     sanitized = response_text
 
     # Remove invalid post IDs
-    for post_id in invalid_claims.get('post_ids', []):
+    post_ids = invalid_claims.get('post_ids', [])
+    if post_ids:
         # Replace with placeholder
         sanitized = re.sub(
-            rf'\b{re.escape(post_id)}\b',
+            rf'\b(?:{_alternation(post_ids)})\b',
             '[REDACTED]',
             sanitized,
             flags=re.IGNORECASE
         )
 
     # Remove invalid creator mentions
-    for creator in invalid_claims.get('creators', []):
+    creators = invalid_claims.get('creators', [])
+    if creators:
         sanitized = re.sub(
-            rf'@{re.escape(creator)}\b',
+            rf'@(?:{_alternation(creators)})\b',
             '@[REDACTED]',
             sanitized,
             flags=re.IGNORECASE
@@ -1040,7 +1088,7 @@ def handler(event: dict, context: Any) -> dict:
     - sql_executed: The SQL query that was executed
     - allowed_values: (optional) JSON string with handles, post_ids, etc. for simplified validation
     """
-    logger.info(f"Validation event received: {json.dumps(event)}")
+    logger.info("Validation event received: %s", event)
 
     try:
         params = extract_parameters(event)